@@ -1,25 +1,28 @@
 """The Bosch eBike integration."""
 import asyncio
 import logging
+import random
 import time
-from dataclasses import replace
 from datetime import timedelta
 from pathlib import Path
 from typing import Any, Final
 
 from homeassistant.config_entries import ConfigEntry, ConfigEntryState
-from homeassistant.const import Platform, CONF_ACCESS_TOKEN, CONF_SCAN_INTERVAL
-from homeassistant.core import HomeAssistant
+from homeassistant.const import Platform, CONF_ACCESS_TOKEN, CONF_SCAN_INTERVAL, EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant, Event, callback
 from homeassistant.exceptions import ConfigEntryNotReady, ConfigEntryAuthFailed
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.config_entry_oauth2_flow import OAuth2Session, LocalOAuth2Implementation
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.typing import UNDEFINED
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 from polyline import polyline
 
 from . import bosch_data_handler
-from .api import BoschEBikeAIOAPI, BoschEBikeOAuthAPI, BoschEBikeAPIError, BoschEBikeAuthError
+from .api import BoschEBikeOAuthAPI, BoschEBikeAPIError, BoschEBikeAuthError
 from .bosch_data_handler import KEY_PROFILE, KEY_SOC, KEY_ACTIVITY, KEY_LOCATION
 from .const import (
     DOMAIN,
@@ -36,13 +39,25 @@ from .const import (
     CONF_BIKE_PASS,
     CONF_LAST_BIKE_ACTIVITY,
     CONF_LOG_TO_FILESYSTEM,
+    CONF_SUBSCRIPTION_STATUS,
+    DEFAULT_SCAN_INTERVAL,
+    ENTRY_DATA_WRITE_DELAY_SECONDS,
+    MIN_SCAN_INTERVAL,
+    SUBSCRIPTION_STATUS_CACHE_SECONDS,
     LOCATION_SCAN_INTERVAL_MINUTES,
+    MAX_OFFLINE_SCAN_INTERVAL_MINUTES,
+    PROFILE_CACHE_SCAN_INTERVALS,
+    CHARGING_SCAN_INTERVAL_MINUTES,
+    MAX_SKIPPED_SOC_UPDATES,
+    MAX_SEQUENTIAL_ACTIVITY_PAGES,
 )
 from .entity import CustomFriendlyNameEntity
 
 _LOGGER = logging.getLogger(__name__)
 
 KEY_COORDINATOR: Final  = "coordinator"
+KEY_OAUTH_IMPLEMENTATION: Final = "oauth_implementation"
+SIGNAL_ACTIVITY_LIST_UPDATED: Final = f"{DOMAIN}_activity_list_updated_{{}}"
 
 # Platforms to set up
 PLATFORMS: Final = [Platform.SENSOR, Platform.BINARY_SENSOR, Platform.DEVICE_TRACKER]
@@ -59,15 +74,15 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry):
                 new_config_entry_data = {**config_entry.data, **{OAUTH_TOKEN_KEY: {
                     CONF_ACCESS_TOKEN: access_token,
                     CONF_REFRESH_TOKEN: refresh_token,
-                    CONF_EXPIRES_AT: time.time()
+                    CONF_EXPIRES_AT: dt_util.utcnow().timestamp()
                 }}}
                 new_config_entry_data.pop(CONF_ACCESS_TOKEN)
                 new_config_entry_data.pop(CONF_REFRESH_TOKEN)
 
                 hass.config_entries.async_update_entry(config_entry, data=new_config_entry_data, options=config_entry.options, version=CONFIG_VERSION, minor_version=CONFIG_MINOR_VERSION)
-                _LOGGER.debug(f"async_migrate_entry(): Migration to configuration version {config_entry.version}.{config_entry.minor_version} successful")
+                _LOGGER.debug("async_migrate_entry(): Migration to configuration version %s.%s successful", config_entry.version, config_entry.minor_version)
             else:
-                _LOGGER.warning(f"async_migrate_entry(): Incompatible config_entry found - this configuration should be removed from your HA - will not migrate {config_entry}")
+                _LOGGER.warning("async_migrate_entry(): Incompatible config_entry found - this configuration should be removed from your HA - will not migrate %s", config_entry)
     return True
 
 
@@ -79,57 +94,75 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     _LOGGER.debug("async_setup_entry(): Setting up Bosch eBike integration")
 
     # Create update coordinator
-    coordinator = BoschEBikeDataUpdateCoordinator(hass=hass, config_entry=config_entry)
-    _LOGGER.info(f"async_setup_entry(): Created coordinator for {coordinator} with update interval: {coordinator.update_interval}")
+    coordinator = BoschEBikeDataUpdateCoordinator(hass=hass, config_entry=config_entry, implementation=get_oauth_implementation(hass))
+    _LOGGER.info("async_setup_entry(): Created coordinator for %s with update interval: %s", coordinator, coordinator.update_interval)
 
     # we need to check some configuration stuff after start...
-    await coordinator.int_after_start()
+    await coordinator.int_after_start_fast()
 
     # Fetch initial data
-    _LOGGER.info(f"Performing initial data refresh for {coordinator.bin}")
+    _LOGGER.info("Performing initial data refresh for %s", coordinator.bin)
     await coordinator.async_refresh()
     if not coordinator.last_update_success:
         raise ConfigEntryNotReady
 
-    _LOGGER.info(f"async_setup_entry(): Initial data refresh complete for {coordinator.bin}")
+    _LOGGER.info("async_setup_entry(): Initial data refresh complete for %s", coordinator.bin)
 
     # Store coordinator in hass.data
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][config_entry.entry_id] = {KEY_COORDINATOR: coordinator}
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    domain_data[config_entry.entry_id] = {KEY_COORDINATOR: coordinator}
+
+    # make sure that pending config entry data updates are not lost (HA does not unload the
+    # config entries when it's stopping)
+    config_entry.async_on_unload(coordinator.async_flush_entry_data)
+    config_entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, coordinator.async_flush_entry_data))
 
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
 
-    # at least we want to log if somebody updated the config entry...
+    # the activity import might need to walk through the complete ride history - so
+    # this is done in the background (the sensors are already online)
+    config_entry.async_create_background_task(hass, coordinator.int_import_activities(), name=f"{DOMAIN}_activity_import_{coordinator.bike_id}")
+
+    # apply changed options (like the scan interval) without a reload
     config_entry.async_on_unload(config_entry.add_update_listener(entry_update_listener))
 
-    _LOGGER.info(f"async_setup_entry(): Bosch eBike integration setup complete for {coordinator.bin}")
+    _LOGGER.info("async_setup_entry(): Bosch eBike integration setup complete for %s", coordinator.bin)
     return True
 
 
-async def entry_update_listener(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
-    _LOGGER.debug(f"entry_update_listener(): called for entry: {config_entry.entry_id}")
+def get_oauth_implementation(hass: HomeAssistant) -> LocalOAuth2Implementation:
+    """Return the OAuth2 implementation - it's the same for all bikes, so it is created only once."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    implementation = domain_data.get(KEY_OAUTH_IMPLEMENTATION, None)
+    if implementation is None:
+        implementation = LocalOAuth2Implementation(
+            hass,
+            DOMAIN,
+            client_id=CLIENT_ID,
+            client_secret="dummy_secret",
+            authorize_url=AUTH_URL,
+            token_url=TOKEN_URL,
+        )
+        domain_data[KEY_OAUTH_IMPLEMENTATION] = implementation
+    return implementation
 
-    # # Get the last known token from our data store
-    # the_entry_data = hass.data[DOMAIN].get(config_entry.entry_id, {})
-    # last_token = the_entry_data.get(LAST_TOKEN_KEY, None)
-    #
-    # # Get the current token from the config entry
-    # current_access_token = config_entry.data.get(OAUTH_TOKEN_KEY, {}).get(OAUTH_ACCESS_TOKEN_KEY, None)
-    #
-    # # If the token has changed, update our store and skip the reload
-    # if current_access_token != last_token:
-    #     _LOGGER.debug(f"entry_update_listener(): only 'access token' was updated, skipping reload.")
-    #     the_entry_data[LAST_TOKEN_KEY] = current_access_token
-    #     return
 
-    # only on 'none' access_token updates, reload the config_entry...
-    # await hass.config_entries.async_reload(config_entry.entry_id)
+async def entry_update_listener(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    _LOGGER.debug("entry_update_listener(): called for entry: %s", config_entry.entry_id)
+    if config_entry.state != ConfigEntryState.LOADED:
+        _LOGGER.debug("entry_update_listener(): config entry is not loaded (state: %s) - skipping", config_entry.state)
+        return
+
+    # the listener is also called for every token refresh (and other data updates) - the
+    # coordinator only applies what actually has been changed
+    coordinator = hass.data[DOMAIN][config_entry.entry_id][KEY_COORDINATOR]
+    coordinator.apply_options()
 
 
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    _LOGGER.debug(f"async_unload_entry(): Unloading Bosch eBike integration - {config_entry.state}")
+    _LOGGER.debug("async_unload_entry(): Unloading Bosch eBike integration - %s", config_entry.state)
     if config_entry.state not in [ConfigEntryState.FAILED_UNLOAD, ConfigEntryState.NOT_LOADED]:
 
         # Unload platforms
@@ -137,34 +170,18 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
         if unload_ok:
             _LOGGER.debug("async_unload_entry(): async_unload_platforms returned True - removing data from hass.data")
             # Remove data
-            hass.data[DOMAIN].pop(config_entry.entry_id, None)
+            hass.data.get(DOMAIN, {}).pop(config_entry.entry_id, None)
 
         return unload_ok
     else:
-        _LOGGER.warning(f"async_unload_entry(): Cannot unload config entry {config_entry.entry_id} because it is not in loaded state - state is {config_entry.state}" )
+        _LOGGER.warning("async_unload_entry(): Cannot unload config entry %s because it is not in loaded state - state is %s", config_entry.entry_id, config_entry.state)
         return False
 
 
-async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Update options."""
-    await hass.config_entries.async_reload(entry.entry_id)
-
-
-async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry."""
-    _LOGGER.debug("async_reload_entry(): triggered")
-    if await async_unload_entry(hass, entry):
-        _LOGGER.debug("async_reload_entry(): call to 'async_unload_entry' returned True")
-        await asyncio.sleep(1.5)
-        if await async_setup_entry(hass, entry):
-            _LOGGER.debug("async_reload_entry(): call to 'async_setup_entry' returned True")
-    _LOGGER.debug("async_reload_entry(): finished")
-
-
 class BoschEBikeDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage to fetch Bosch eBike data from the API."""
 
-    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry, implementation: LocalOAuth2Implementation) -> None:
         # the bin is the vin of a bike ;-)
         self.config_entry = config_entry
         self.bike_id = config_entry.data[CONF_BIKE_ID]
@@ -177,25 +194,13 @@ class BoschEBikeDataUpdateCoordinator(DataUpdateCoordinator):
         else:
             self._bin = self.bike_id
 
-        # creating our OAuth2Session-session...
-        implementation = LocalOAuth2Implementation(
-            hass,
-            DOMAIN,
-            client_id=CLIENT_ID,
-            client_secret="dummy_secret",
-            authorize_url=AUTH_URL,
-            token_url=TOKEN_URL,
-        )
-
-        if config_entry.options.get(CONF_LOG_TO_FILESYSTEM, False):
-            _log_storage_path = Path(hass.config.config_dir).joinpath(STORAGE_DIR)
-        else:
-            _log_storage_path = None
-
+        # creating our OAuth2Session-session (the OAuth2Session is only used for the token
+        # handling - the requests are made via the shared (keep-alive) ClientSession of HA)...
         self.api = BoschEBikeOAuthAPI(
             bin=self._bin,
             oauth_session=OAuth2Session(hass, config_entry, implementation),
-            log_storage_path=_log_storage_path
+            log_storage_path=self._get_log_storage_path(hass, config_entry),
+            session=async_get_clientsession(hass)
         )
 
         self.has_flow_subscription = False
@@ -213,21 +218,90 @@ class BoschEBikeDataUpdateCoordinator(DataUpdateCoordinator):
         self._pending_activity_refresh_task: asyncio.Task | None = None
 
         """Initialize the coordinator."""
-        scan_interval:Final = timedelta(minutes=max(config_entry.options.get(CONF_SCAN_INTERVAL, 5), 1))
-        #scan_interval = timedelta(seconds=10)
-        super().__init__(hass, _LOGGER, name=f"{DOMAIN}_{self.bike_id}", update_interval=scan_interval)
+        scan_interval:Final = self._get_scan_interval(config_entry)
+        # unchanged data (see end of _async_update_data()) must not trigger a state write of
+        # all the entities
+        super().__init__(hass, _LOGGER, name=f"{DOMAIN}_{self.bike_id}", update_interval=scan_interval, always_update=False)
+
+        # the configured interval - the effective update_interval will be adjusted based on
+        # the online/offline state of the bike
+        self._base_update_interval = scan_interval
+        self._soc_unavailable_count = 0
+        self._soc_skipped_updates = 0
+        self._profile_fetched_at: float = float("-inf")
+        self._device_info: tuple[tuple, dict[str, Any]] | None = None
+
+        # config entry data updates are collected and written together (every update
+        # serializes the complete config entries storage)
+        self._pending_entry_data: dict[str, Any] = {}
+        self._pending_entry_data_handle: asyncio.TimerHandle | None = None
+
+    @staticmethod
+    def _get_scan_interval(config_entry: ConfigEntry) -> timedelta:
+        return timedelta(minutes=max(config_entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL), MIN_SCAN_INTERVAL))
+
+    @staticmethod
+    def _get_log_storage_path(hass: HomeAssistant, config_entry: ConfigEntry) -> Path | None:
+        if config_entry.options.get(CONF_LOG_TO_FILESYSTEM, False):
+            return Path(hass.config.config_dir).joinpath(STORAGE_DIR)
+        return None
+
+    def apply_options(self) -> None:
+        """Apply changed options in-place - no need to reload the complete config entry (and
+        refetch everything from the Bosch API) just because the scan interval was changed."""
+        self.api.log_storage_path = self._get_log_storage_path(self.hass, self.config_entry)
+
+        scan_interval = self._get_scan_interval(self.config_entry)
+        if scan_interval != self._base_update_interval:
+            _LOGGER.debug("apply_options(): scan interval changed from %s to %s", self._base_update_interval, scan_interval)
+            self._base_update_interval = scan_interval
+            self._soc_unavailable_count = 0
+            self._soc_skipped_updates = 0
+            self.update_interval = scan_interval
+            self._schedule_refresh()
+
+    @callback
+    def async_update_entry_data(self, data: dict[str, Any]) -> None:
+        """Queue an update of the config entry data - pending updates are written with a short delay."""
+        self._pending_entry_data.update(data)
+        if self._pending_entry_data_handle is None:
+            self._pending_entry_data_handle = self.hass.loop.call_later(ENTRY_DATA_WRITE_DELAY_SECONDS, self.async_flush_entry_data)
+
+    @callback
+    def async_flush_entry_data(self, event: Event | None = None) -> None:
+        """Write all pending config entry data updates at once."""
+        if self._pending_entry_data_handle is not None:
+            self._pending_entry_data_handle.cancel()
+            self._pending_entry_data_handle = None
+
+        if len(self._pending_entry_data) > 0:
+            new_data = {**self.config_entry.data, **self._pending_entry_data}
+            self._pending_entry_data = {}
+            self.hass.config_entries.async_update_entry(self.config_entry, data=new_data)
 
     @property
     def bin(self) -> str | None:
         """Get the current access token."""
         return self._bin
 
-    async def int_after_start(self) -> None:
-        """We are initializing our data coordinator after Home Assistant startup."""
+    async def int_after_start_fast(self) -> None:
+        """We are initializing our data coordinator after Home Assistant startup.
+
+        Only the (cheap) requests that are required for the initial data refresh are
+        made here - the activity import is done by int_import_activities().
+        """
         if self.hass.is_stopping:
             return False
 
-        self.has_flow_subscription = await self.api.get_subscription_status()
+        # the bike pass is independent of the subscription/BCM checks - so both are
+        # requested concurrently
+        if self.config_entry.data.get(CONF_BIKE_PASS, None) is None:
+            await asyncio.gather(self._int_check_subscription_and_bcm(), self._int_fetch_bike_pass())
+        else:
+            await self._int_check_subscription_and_bcm()
+
+    async def _int_check_subscription_and_bcm(self) -> None:
+        self.has_flow_subscription = await self.get_subscription_status()
 
         # only when we have a flow subscription, we should check additionally for bmc
         if self.has_flow_subscription:
@@ -235,70 +309,121 @@ class BoschEBikeDataUpdateCoordinator(DataUpdateCoordinator):
             # theft-detection service can provide the last known location
             registrations = await self.api.get_bcm_registrations(bike_id=self.bike_id)
             self.has_bcm = bool(registrations and registrations.get("registrations"))
-            _LOGGER.debug(f"int_after_start(): BCM registration found: {self.has_bcm}")
-
-        # check if we already have a bike pass object (important for migrated
-        # config entries)
-        if self.config_entry.data.get(CONF_BIKE_PASS, None) is None:
-            _LOGGER.info("int_after_start(): need to fetch bike pass...")
-            pass_data_src = await self.api.get_bike_pass(bike_id=self.bike_id)
-            if pass_data_src is not None and pass_data_src.get("frameNumber") is not None:
-                pass_data = {CONF_BIKE_PASS: {
-                    "frame": pass_data_src.get("frameNumber"),
-                    "created_at": pass_data_src.get("createdAt"),
-                }}
-                _LOGGER.info(f"int_after_start(): fetched bike pass with frame number: {self.bin}")
-            else:
-                # creating a FAKE-BikePass - to avoid requests on restarts...
-                from datetime import datetime, timezone
-                # Generate the string and replace the +00:00 offset with Z
-                pass_data = {CONF_BIKE_PASS: {
-                    "frame": f"NOBIKEPASS_{self.bike_id}",
-                    "created_at": datetime.now(timezone.utc).isoformat(timespec='seconds').replace('+00:00', 'Z'),
-                }}
-                _LOGGER.info(f"int_after_start(): Failed to fetch bike pass for bike {self.bike_id}")
+            _LOGGER.debug("_int_check_subscription_and_bcm(): BCM registration found: %s", self.has_bcm)
+
+    async def _int_fetch_bike_pass(self) -> None:
+        # we do not have a bike pass object yet (important for migrated config entries)
+        _LOGGER.info("_int_fetch_bike_pass(): need to fetch bike pass...")
+        pass_data_src = await self.api.get_bike_pass(bike_id=self.bike_id)
+        if pass_data_src is not None and pass_data_src.get("frameNumber") is not None:
+            pass_data = {CONF_BIKE_PASS: {
+                "frame": pass_data_src.get("frameNumber"),
+                "created_at": pass_data_src.get("createdAt"),
+            }}
+            _LOGGER.info("_int_fetch_bike_pass(): fetched bike pass with frame number: %s", pass_data_src.get("frameNumber"))
+        else:
+            # creating a FAKE-BikePass - to avoid requests on restarts...
+            from datetime import datetime, timezone
+            # Generate the string and replace the +00:00 offset with Z
+            pass_data = {CONF_BIKE_PASS: {
+                "frame": f"NOBIKEPASS_{self.bike_id}",
+                "created_at": datetime.now(timezone.utc).isoformat(timespec='seconds').replace('+00:00', 'Z'),
+            }}
+            _LOGGER.info("_int_fetch_bike_pass(): Failed to fetch bike pass for bike %s", self.bike_id)
+
+        self.async_update_entry_data(pass_data)
+        self._bin = pass_data.get(CONF_BIKE_PASS, {}).get("frame", self.bike_id)
+
+    async def get_subscription_status(self) -> bool:
+        """Get the 'Flow'-subscription status - from the config entry, if it has been checked recently."""
+        cached_status = self.config_entry.data.get(CONF_SUBSCRIPTION_STATUS, None)
+        if cached_status is not None and time.time() - cached_status.get("ts", 0) < SUBSCRIPTION_STATUS_CACHE_SECONDS:
+            _LOGGER.debug("get_subscription_status(): using cached subscription status: %s", cached_status.get('value'))
+            return bool(cached_status.get("value", False))
+
+        status = await self.api.get_subscription_status()
+        if status is None:
+            # the status could not be fetched - we don't store this (so we will try again on the next start)
+            return False
 
-            self.hass.config_entries.async_update_entry(self.config_entry, data={**self.config_entry.data, **pass_data})
-            self._bin = pass_data.get(CONF_BIKE_PASS, {}).get("frame", self.bike_id)
+        self.async_update_entry_data({CONF_SUBSCRIPTION_STATUS: {
+            "value": bool(status),
+            "ts": time.time(),
+        }})
+        return bool(status)
 
+    async def int_import_activities(self) -> None:
+        """Fetch the (new) activities of the bike - running as background task after the setup."""
+        if self.hass.is_stopping:
+            return
 
         # do we need to import activities? [including the past statistics?]
         last_processed_activity = self.config_entry.data.get(CONF_LAST_BIKE_ACTIVITY, None)
-        must_import_all = False
-        if last_processed_activity is None:
-            must_import_all = True
-        else:
-            recent_activities = await self.api.get_activity_list_recent(bike_id=self.bike_id)
-            _LOGGER.debug(f"int_after_start(): Fetched RECENT activity list with {len(recent_activities)} entries")
+        try:
+            if last_processed_activity is None:
+                # looks like we have never imported the activity list into the odometer sensor statistics... so we
+                # have to walk through ALL pages (the pages will be fetched concurrently)
+                _LOGGER.debug("int_import_activities(): No last processed activity - must process all")
+                new_activities = await self.api.get_activity_list_complete(bike_id=self.bike_id)
+            else:
+                # the pages are fetched one by one (most recent first) - as soon as we have found the last
+                # processed activity, we stop requesting any further (older) pages... (the polyline is
+                # only needed for the most recent activity - so it's only requested with the first page)
+                new_activities = []
+                found = False
+                walked_pages = 0
+                async for page_activities in self.api.get_activity_list_paginated(bike_id=self.bike_id, include_polyline=True):
+                    # get_activity_list_paginated() only returns activities with an 'id' - so we can
+                    # safely use the direct key access here...
+                    idx = next((i for i, a_activity in enumerate(page_activities) if a_activity["id"] == last_processed_activity), None)
+                    if idx is not None:
+                        if idx == 0 and len(new_activities) == 0:
+                            _LOGGER.debug("int_import_activities(): Last processed activity %s is still the most recent one.", last_processed_activity)
+                            self.last_activity = page_activities[0]
+                        new_activities.extend(page_activities[:idx])
+                        found = True
+                        break
 
-            if recent_activities is not None and len(recent_activities) > 0:
-                idx = 0
-                for activity in recent_activities:
-                    if activity.get("id") == last_processed_activity:
+                    new_activities.extend(page_activities)
+                    walked_pages += 1
+                    if walked_pages >= MAX_SEQUENTIAL_ACTIVITY_PAGES:
                         break
-                    idx += 1
-
-                if idx == 0:
-                    _LOGGER.debug(f"int_after_start(): Last processed activity {last_processed_activity} is still the most recent one.")
-                    self.last_activity = recent_activities[0]
-                elif idx < len(recent_activities):
-                    self.activity_list = recent_activities[:idx]
-                    _LOGGER.debug(f"int_after_start(): Processing new activity list with {len(self.activity_list)} entries")
-                else:
-                    must_import_all = True
-                    _LOGGER.debug(f"int_after_start(): Last processed activity {last_processed_activity} not found in the activity list - must process all")
 
-        if must_import_all:
-            # looks like we have never imported the activity list into the odometer sensor statistics... so we do it now
-            self.activity_list = await self.api.get_activity_list_complete(bike_id=self.bike_id)
-            _LOGGER.debug(f"int_after_start(): Fetched ALL activity list with {len(self.activity_list)} entries")
+                if not found:
+                    # the last processed activity has been deleted (or is older than the first pages) - then
+                    # all pages are fetched concurrently (without the polylines)
+                    _LOGGER.debug("int_import_activities(): Last processed activity %s not found in the recent activities - must process all", last_processed_activity)
+                    new_activities = await self.api.get_activity_list_complete(bike_id=self.bike_id)
+
+        except BoschEBikeAuthError:
+            raise
+        except BoschEBikeAPIError as err:
+            # a missing page would leave a gap in the imported activities (that would never be
+            # filled, since the last processed activity would move on) - so nothing is imported
+            _LOGGER.warning("int_import_activities(): Fetching the activities failed - skipping the import: %s", err)
+            return
+
+        if len(new_activities) > 0:
+            self.activity_list = new_activities
+            _LOGGER.debug("int_import_activities(): Processing new activity list with %s entries", len(self.activity_list))
 
         # for our sensor's we keep track of the last activity that we have processed, so we don't process it again on next update...
         if self.activity_list is not None and len(self.activity_list) > 0:
             self.last_activity = self.activity_list[0]
-            _LOGGER.debug(f"int_after_start(): set the last_activity to {self.last_activity.get('id')}")
+            _LOGGER.debug("int_import_activities(): set the last_activity to %s", self.last_activity.get('id'))
+
+        # the location from the Bosch API (BCM) always wins over the polyline based one
+        if self.location_data is None:
+            self.calc_bike_last_location_from_polyline()
+
+        if self.data is not None:
+            self.async_set_updated_data({**self.data,
+                                         KEY_ACTIVITY: self.last_activity,
+                                         KEY_LOCATION: self.location_data})
 
-        self.calc_bike_last_location_from_polyline()
+        # let the total-distance sensor import the statistics of the new activities
+        if self.activity_list is not None and len(self.activity_list) > 0:
+            async_dispatcher_send(self.hass, SIGNAL_ACTIVITY_LIST_UPDATED.format(self.bike_id))
 
 
     def calc_bike_last_location_from_polyline(self, activity=None):
@@ -307,12 +432,12 @@ class BoschEBikeDataUpdateCoordinator(DataUpdateCoordinator):
 
         if activity is not None:
             try:
-                a_polyline_str = activity.get("attributes", {}).get("polyline")
+                a_polyline_str = bosch_data_handler._deep_get(activity, "attributes", "polyline")
 
                 if a_polyline_str:
                     decoded_polyline = polyline.decode(a_polyline_str, precision=6)
                     last_location = decoded_polyline[-1]
-                    _LOGGER.debug(f"calc_bike_last_location_from_polyline(): last location from last polyline-point: {last_location}")
+                    _LOGGER.debug("calc_bike_last_location_from_polyline(): last location from last polyline-point: %s", last_location)
 
                     # a simple self-created location object... as it would be returned by the Bosch API
                     self.location_data = {"locations":[{
@@ -321,8 +446,8 @@ class BoschEBikeDataUpdateCoordinator(DataUpdateCoordinator):
                         "longitude": last_location[1]
                     }]}
 
-            except BaseException as ex:
-                _LOGGER.debug(f"calc_bike_last_location_from_polyline(): error: {type(ex).__name__} - {ex}")
+            except Exception as ex:
+                _LOGGER.debug("calc_bike_last_location_from_polyline(): error: %s - %s", type(ex).__name__, ex)
 
 
     async def _async_update_data(self) -> dict[str, Any]:
@@ -331,29 +456,81 @@ class BoschEBikeDataUpdateCoordinator(DataUpdateCoordinator):
             raise UpdateFailed(f"HASS is stopping - cannot update data")
 
         try:
-            _LOGGER.debug(f"_async_update_data(): === COORDINATOR UPDATE TRIGGERED for bike {self.bike_id} ===")
+            # Fetch bike profile (static info + last known battery state) and try to fetch
+            # live state of charge (only works when bike is online/charging) - all requests
+            # (including the BCM location check) are independent of each other, so we run
+            # them concurrently. While live data is available, the last profile is reused for
+            # a while (see can_reuse_profile())
+            soc_data = None
+            soc_rate_limited = False
+            fetch_soc = self.should_fetch_soc()
+            reuse_profile = fetch_soc and self.can_reuse_profile()
+            requests = [self.check_bcm_location()]
+            if not reuse_profile:
+                requests.append(self.api.get_bike_profile(self.bike_id))
+            if fetch_soc:
+                requests.append(self.api.get_state_of_charge(self.bike_id))
+
+            location_result, *results = await asyncio.gather(*requests, return_exceptions=True)
+            if isinstance(location_result, BaseException):
+                # check_bcm_location() only raises auth errors (or CancelledError)
+                raise location_result
+
+            if reuse_profile:
+                profile_data = self.data[KEY_PROFILE]
+            else:
+                profile_data = results[0]
+                if isinstance(profile_data, BaseException):
+                    raise profile_data
+                self._profile_fetched_at = time.monotonic()
+
+            if fetch_soc:
+                soc_result = results[-1]
+                if isinstance(soc_result, BoschEBikeAuthError) or (isinstance(soc_result, BaseException) and not isinstance(soc_result, Exception)):
+                    # CancelledError (or KeyboardInterrupt/SystemExit) must not be swallowed -
+                    # otherwise we would delay the shutdown of HA
+                    raise soc_result
+                elif isinstance(soc_result, Exception):
+                    # This is expected when the bike is offline - not an error (and happens on
+                    # every poll then) - but a rate limited request says nothing about the bike
+                    soc_rate_limited = isinstance(soc_result, BoschEBikeAPIError) and soc_result.status_code == 429
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug("_async_update_data(): get_state_of_charge caused %s - %s", type(soc_result).__name__, soc_result)
+                else:
+                    soc_data = soc_result
+                    _LOGGER.debug("_async_update_data(): Got live state-of-charge data")
 
-            # Fetch bike profile (static info + last known battery state)
-            profile_data = await self.api.get_bike_profile(self.bike_id)
+                    # the battery related profile data (charge cycles, delivered energy) changes
+                    # with the charging - so the next update will fetch the profile again
+                    last_soc_data = self.data.get(KEY_SOC) if self.data is not None else None
+                    if (last_soc_data is not None and
+                            (last_soc_data.get("chargingActive") != soc_data.get("chargingActive") or
+                             last_soc_data.get("chargerConnected") != soc_data.get("chargerConnected"))):
+                        _LOGGER.debug("_async_update_data(): charging state changed - profile will be fetched with the next update")
+                        self.async_invalidate_profile()
+
+            if reuse_profile and soc_data is None:
+                # without the live data, the battery state of the profile is required
+                _LOGGER.debug("_async_update_data(): No live data - fetching the bike profile")
+                profile_data = await self.api.get_bike_profile(self.bike_id)
+                self._profile_fetched_at = time.monotonic()
 
             if profile_data is None:
-                _LOGGER.warning(f"_async_update_data(): get_bike_profile() returned None - skipping fetching of live state-of-charge data")
+                _LOGGER.warning("_async_update_data(): get_bike_profile() returned None - skipping this update")
                 raise UpdateFailed("get_bike_profile() returned no data")
 
-            # Try to fetch live state of charge (only works when bike is online/charging)
-            soc_data = None
-            if self.has_flow_subscription:
-                try:
-                    soc_data = await self.api.get_state_of_charge(self.bike_id)
-                    _LOGGER.debug("_async_update_data(): Got live state-of-charge data")
-                except BoschEBikeAuthError:
-                    raise
-                except BaseException as err:
-                    # This is expected when the bike is offline - not an error
-                    _LOGGER.debug(f"_async_update_data(): get_state_of_charge caused {type(err).__name__} - {err}")
-            else:
-                pass
-                # _LOGGER.debug("_async_update_data(): No 'Bosch-Flow'-Subscription - skipping fetching of live state-of-charge data")
+            # without a subscription we never get live data - so there is nothing we could adjust
+            if fetch_soc and not soc_rate_limited:
+                self.adjust_update_interval(soc_data=soc_data)
+            elif not self.has_flow_subscription:
+                # a previous rate limit might have extended the interval
+                self.update_interval = self._base_update_interval
+
+            # after a 429 there is no need to poll again before the backend accepts requests
+            rate_limit_remaining = self.api.rate_limit_remaining
+            if rate_limit_remaining > 0 and self.update_interval.total_seconds() < rate_limit_remaining:
+                self.update_interval = timedelta(seconds=rate_limit_remaining + random.uniform(0, 15))
+                _LOGGER.debug("_async_update_data(): rate limited - next update in %s", self.update_interval)
 
             # we check, if the odometer has been updated, and IF this is the case, we will trigger an update of
             # the 'last-activity'
@@ -362,7 +539,10 @@ class BoschEBikeDataUpdateCoordinator(DataUpdateCoordinator):
                 new_odometer_val = bosch_data_handler.get_total_distance({KEY_PROFILE: profile_data, KEY_SOC: soc_data})
 
                 if last_odometer_val is not None and new_odometer_val is not None and new_odometer_val > last_odometer_val:
-                    _LOGGER.debug(f"_async_update_data(): Updated last processed activity to due to new odometer value changed from '{last_odometer_val}' to '{new_odometer_val}'")
+                    # after a ride the profile data (e.g. motor hours) has changed
+                    self.async_invalidate_profile()
+
+                    _LOGGER.debug("_async_update_data(): Updated last processed activity to due to new odometer value changed from '%s' to '%s'", last_odometer_val, new_odometer_val)
 
                     # Cancel any previously pending delayed refresh so only the most recent
                     # odometer-change event triggers the final activity update.
@@ -377,9 +557,6 @@ class BoschEBikeDataUpdateCoordinator(DataUpdateCoordinator):
                             delay_in_minutes = 1)
                     )
 
-            # check & update the location data from the Bosch API (only when a ConnectModule is registered)
-            await self.check_bcm_location()
-
             new_data = {
                 KEY_PROFILE: profile_data,
                 KEY_SOC: soc_data,
@@ -387,18 +564,114 @@ class BoschEBikeDataUpdateCoordinator(DataUpdateCoordinator):
                 KEY_LOCATION: self.location_data
             }
 
-            _LOGGER.debug(f"_async_update_data(): === COORDINATOR UPDATE COMPLETE for bike {self.bike_id} ===")
+            # when the Bosch backend returned the same data again, we keep the previous data
+            # object - so the entities can reuse what they have calculated from it
+            if new_data == self.data:
+                return self.data
             return new_data
 
         except BoschEBikeAuthError as err:
-            _LOGGER.error(f"_async_update_data(): Authentication failed - reauthentication required: {err}")
+            _LOGGER.error("_async_update_data(): Authentication failed - reauthentication required: %s", err)
             raise ConfigEntryAuthFailed(f"Authentication failed: {err}") from err
 
         except BoschEBikeAPIError as err:
-            _LOGGER.error(f"_async_update_data():Error fetching bike data: {err}")
+            _LOGGER.error("_async_update_data():Error fetching bike data: %s", err)
             raise UpdateFailed(f"Error communicating with Bosch API: {err}") from err
 
 
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """The device info of the bike (rebuilt only, when the drive unit data has changed)."""
+        drive_unit = bosch_data_handler._get_drive_unit(self.data)
+        cache_key = (drive_unit.get("productName"), drive_unit.get("softwareVersion"), drive_unit.get("serialNumber"))
+        if self._device_info is not None and self._device_info[0] == cache_key:
+            return self._device_info[1]
+
+        # Build enhanced device info from component data
+        device_info = {
+            "identifiers": {(DOMAIN, self.bike_id)},
+            "name": self.bike_name,
+            "manufacturer": "Bosch",
+        }
+
+        # Add component details if available
+        if len(drive_unit) > 0:
+            # Set model from drive unit
+            if drive_unit.get("productName"):
+                device_info["model"] = drive_unit["productName"]
+
+            # Add software version
+            if drive_unit.get("softwareVersion"):
+                device_info["sw_version"] = f"DU: {drive_unit['softwareVersion']}"
+
+            # Add serial number
+            if drive_unit.get("serialNumber"):
+                device_info["serial_number"] = drive_unit["serialNumber"]
+
+        if not device_info.get("model"):
+            device_info["model"] = "eBike with/without ConnectModule"
+
+        self._device_info = (cache_key, device_info)
+        return device_info
+
+    def can_reuse_profile(self) -> bool:
+        """Check if the last fetched bike profile can be used for this update.
+
+        Most of the profile is static - and while live state-of-charge data is available, the
+        battery state of the profile is not used - so the profile is only fetched every
+        PROFILE_CACHE_SCAN_INTERVALS (base) scan intervals.
+        """
+        return (self.data is not None and self.data.get(KEY_PROFILE) is not None and self.data.get(KEY_SOC) is not None
+                and time.monotonic() - self._profile_fetched_at < self._base_update_interval.total_seconds() * PROFILE_CACHE_SCAN_INTERVALS)
+
+    @callback
+    def async_invalidate_profile(self) -> None:
+        """Make sure that the bike profile is fetched with the next update."""
+        self._profile_fetched_at = float("-inf")
+
+    def should_fetch_soc(self) -> bool:
+        """Check if the live state-of-charge should be requested in this update."""
+        if not self.has_flow_subscription:
+            return False
+
+        if self._soc_unavailable_count == 0 or self.data is None:
+            return True
+
+        # when the last known profile reports a connected charger, the ConnectModule should be online
+        battery = bosch_data_handler._get_first_battery(self.data)
+        if battery.get("isChargerConnected") or battery.get("isCharging"):
+            self._soc_skipped_updates = 0
+            return True
+
+        # the bike was offline the last time(s) - so we only try again every 2nd, 4th,... update - but
+        # the skipped updates and the (already extended) update interval must not add up to more than
+        # MAX_OFFLINE_SCAN_INTERVAL_MINUTES without a single try
+        max_skipped_updates = min(2 ** (self._soc_unavailable_count - 1) - 1, MAX_SKIPPED_SOC_UPDATES,
+                                  int(MAX_OFFLINE_SCAN_INTERVAL_MINUTES * 60 // self.update_interval.total_seconds()) - 1)
+        if self._soc_skipped_updates >= max_skipped_updates:
+            self._soc_skipped_updates = 0
+            return True
+
+        self._soc_skipped_updates += 1
+        return False
+
+    def adjust_update_interval(self, soc_data: dict[str, Any] | None) -> None:
+        """Poll less frequently while the bike is offline (no live state-of-charge data) and
+        more frequently while it's charging."""
+        if soc_data is not None:
+            self._soc_unavailable_count = 0
+            base_update_interval = self._base_update_interval
+            if soc_data.get("chargingActive"):
+                base_update_interval = min(base_update_interval, timedelta(minutes=CHARGING_SCAN_INTERVAL_MINUTES))
+            # a small jitter - so multiple bikes will not be polled at the very same time
+            self.update_interval = base_update_interval + timedelta(seconds=random.uniform(0, 15))
+        else:
+            # limit the exponent - the interval is capped anyhow
+            self._soc_unavailable_count = min(self._soc_unavailable_count + 1, 10)
+            self.update_interval = min(self._base_update_interval * 2 ** self._soc_unavailable_count,
+                                       timedelta(minutes=max(MAX_OFFLINE_SCAN_INTERVAL_MINUTES, self._base_update_interval.total_seconds() / 60)))
+            _LOGGER.debug("adjust_update_interval(): no live data available (%sx) - next update in %s", self._soc_unavailable_count, self.update_interval)
+
     async def check_bcm_location(self):
         # Fetch the last known location (throttled - it only changes when the
         # ConnectModule reports home, so we don't need it on every cycle)
@@ -414,14 +687,14 @@ class BoschEBikeDataUpdateCoordinator(DataUpdateCoordinator):
 
                 except BoschEBikeAuthError:
                     raise
-                except BaseException as err:
-                    _LOGGER.debug(f"_async_update_data(): get_latest_locations caused {type(err).__name__} - {err}")
+                except Exception as err:
+                    _LOGGER.debug("_async_update_data(): get_latest_locations caused %s - %s", type(err).__name__, err)
 
     async def _async_delayed_activity_and_location_refresh(self, last_known_activity_id:str, delay_in_minutes: int = 1, total_wait_time_in_minutes: int = 0, max_wait_time_in_minutes: int = 305) -> None:
         """Wait delay_in_minutes, then re-fetch the latest activity and push a coordinator update.
 
-        If a newer call cancels this task while it is sleeping, CancelledError is caught
-        and the method returns silently — only the last scheduled task proceeds.
+        If a newer call cancels this task while it is sleeping, the cancellation is logged
+        and propagated — only the last scheduled task proceeds.
 
         When the activity id has not changed yet (Bosch backend not yet updated), the task
         reschedules itself with a longer delay up to max_wait_time_in_minutes.
@@ -431,19 +704,19 @@ class BoschEBikeDataUpdateCoordinator(DataUpdateCoordinator):
         try:
             await asyncio.sleep(delay_in_minutes * 60)
         except asyncio.CancelledError:
-            _LOGGER.debug("_async_delayed_activity_and_location_refresh(): Task superseded by a newer one — skipping")
-            return
+            _LOGGER.debug("_async_delayed_activity_and_location_refresh(): Task superseded by a newer one (or HA is stopping) — skipping")
+            raise
 
         if self.hass.is_stopping:
             return
 
         try:
-            _LOGGER.debug(f"_async_delayed_activity_and_location_refresh(): Fetching latest activity after delay ({total_wait_time_in_minutes}/{max_wait_time_in_minutes})")
+            _LOGGER.debug("_async_delayed_activity_and_location_refresh(): Fetching latest activity after delay (%s/%s)", total_wait_time_in_minutes, max_wait_time_in_minutes)
 
             # now check the recent activities...
             recent_activities = await self.api.get_activity_list_recent(bike_id=self.bike_id, size=1)
             if recent_activities is not None and len(recent_activities) > 0:
-                _LOGGER.debug(f"_async_delayed_activity_and_location_refresh(): Fetched RECENT activity list with {len(recent_activities)} entries")
+                _LOGGER.debug("_async_delayed_activity_and_location_refresh(): Fetched RECENT activity list with %s entries", len(recent_activities))
                 most_recent_activity = recent_activities[0]
 
                 if most_recent_activity:
@@ -458,7 +731,7 @@ class BoschEBikeDataUpdateCoordinator(DataUpdateCoordinator):
 
                         if total_wait_time_in_minutes < max_wait_time_in_minutes:
                             next_delay_in_minutes = min(delay_in_minutes * 2, 15)
-                            _LOGGER.debug(f"_async_delayed_activity_and_location_refresh(): Activity id unchanged ({last_known_activity_id}), retrying in {next_delay_in_minutes} minutes [already waited ({total_wait_time_in_minutes}/{max_wait_time_in_minutes})")
+                            _LOGGER.debug("_async_delayed_activity_and_location_refresh(): Activity id unchanged (%s), retrying in %s minutes [already waited (%s/%s)", last_known_activity_id, next_delay_in_minutes, total_wait_time_in_minutes, max_wait_time_in_minutes)
                             self._pending_activity_refresh_task = self.hass.async_create_task(
                                 self._async_delayed_activity_and_location_refresh(
                                     last_known_activity_id = last_known_activity_id,
@@ -472,7 +745,7 @@ class BoschEBikeDataUpdateCoordinator(DataUpdateCoordinator):
                             self._LAST_LOCATION_FETCH = -1
                             return
                         else:
-                            _LOGGER.warning(f"_async_delayed_activity_and_location_refresh(): No new activity (id: {last_known_activity_id}) found after {max_wait_time_in_minutes} minutes — giving up")
+                            _LOGGER.warning("_async_delayed_activity_and_location_refresh(): No new activity (id: %s) found after %s minutes — giving up", last_known_activity_id, max_wait_time_in_minutes)
 
                     # finally setting the last_activity to the new activity (even if it is the same as before)
                     self.last_activity = most_recent_activity
@@ -491,20 +764,16 @@ class BoschEBikeDataUpdateCoordinator(DataUpdateCoordinator):
                                          KEY_ACTIVITY: self.last_activity,
                                          KEY_LOCATION: self.location_data})
 
-        except BaseException as err:
-            _LOGGER.warning(f"_async_delayed_activity_and_location_refresh(): Failed: {type(err).__name__} - {err}")
+        except Exception as err:
+            # a CancelledError (superseded refresh or HA shutdown) must not be swallowed
+            _LOGGER.warning("_async_delayed_activity_and_location_refresh(): Failed: %s - %s", type(err).__name__, err)
 
 
 class BoschEBikeEntity(CustomFriendlyNameEntity):
     _attr_has_entity_name = True
 
     def __init__(self, entity_type:str, coordinator: BoschEBikeDataUpdateCoordinator, description: EntityDescription) -> None:
-        # make sure we have a valid translation_key...
-        if description.translation_key is None:
-            description = replace(
-                description,
-                translation_key = f"{description.key}"
-            )
+        # all descriptions come with a translation_key (see const._with_translation_keys())
         super().__init__(coordinator, description)
         self.coordinator = coordinator
         self.entity_description = description
@@ -513,40 +782,23 @@ class BoschEBikeEntity(CustomFriendlyNameEntity):
         self._attr_unique_id = f"{coordinator.bike_id}_{description.key}"
 
         # we need also a 'shorter' entity-id
-        self.entity_id = f"{entity_type}.bfe_{coordinator.bin.lower()}_{description.key}".lower()
-
-        # Build enhanced device info from component data
-        device_info = {
-            "identifiers": {(DOMAIN, coordinator.bike_id)},
-            "name": coordinator.bike_name,
-            "manufacturer": "Bosch",
-        }
-
-        # Add component details if available
-        drive_unit = bosch_data_handler._get_drive_unit(coordinator.data)
-        if len(drive_unit) > 0:
-            # Set model from drive unit
-            if drive_unit.get("productName"):
-                device_info["model"] = drive_unit["productName"]
-
-            # Add software version
-            if drive_unit.get("softwareVersion"):
-                device_info["sw_version"] = f"DU: {drive_unit['softwareVersion']}"
-
-            # Add serial number
-            if drive_unit.get("serialNumber"):
-                device_info["serial_number"] = drive_unit["serialNumber"]
-
+        self.entity_id = f"{entity_type}.bfe_{coordinator.bin}_{description.key}".lower()
 
-        if not device_info.get("model"):
-            device_info["model"] = "eBike with/without ConnectModule"
+        # all entities share the device info of the coordinator
+        self._attr_device_info = coordinator.device_info
+        self._attr_available = coordinator.last_update_success and coordinator.data is not None
 
-        self._attr_device_info = device_info
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # the coordinator informs its listeners also about failed updates
+        self._attr_available = self.coordinator.last_update_success and self.coordinator.data is not None
+        super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
-        """Return if the entity is available."""
-        return super().available and self.coordinator.data is not None
+        """Return if the entity is available (updated with each coordinator update)."""
+        return self._attr_available
 
     def _friendly_name_internal(self) -> str | None:
         """Return the friendly name.
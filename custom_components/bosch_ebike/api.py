@@ -7,13 +7,18 @@ import logging
 import os
 import secrets
 import time
-from asyncio import timeout
+from collections.abc import AsyncGenerator
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Final
 from urllib.parse import urlencode
 
 import aiohttp
+try:
+    # orjson (a requirement of HA core) parses the (large) activity responses a lot faster
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 # from homeassistant.exceptions import OAuth2TokenRequestReauthError
 from homeassistant.helpers.config_entry_oauth2_flow import OAuth2Session
 
@@ -24,6 +29,7 @@ from .const import (
     REDIRECT_URI,
     CLIENT_ID,
     SCOPE,
+    TOKEN_REFRESH_BUFFER_SECONDS,
 
     PROFILE_API_BASE_URL,
     PROFILE_ENDPOINT_BIKE_PROFILE,
@@ -46,6 +52,13 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# the per-bike endpoints only need to be completed with the bike id (or page parameters)
+_BIKE_PROFILE_V2_PREFIX: Final = f"{PROFILE_ENDPOINT_BIKE_PROFILE_V2}/"
+_STATE_OF_CHARGE_PREFIX: Final = f"{PROFILE_ENDPOINT_STATE_OF_CHARGE}/"
+_BCM_REGISTRATIONS_PREFIX: Final = f"{THEFT_DETECTION_ENDPOINT_REGISTRATIONS}?bikeId="
+_BCM_LATEST_LOCATIONS_PREFIX: Final = f"{THEFT_DETECTION_ENDPOINT_LATEST_LOCATIONS}?bikeId="
+_ACTIVITIES_PAGE_QUERY: Final = ACTIVITIES_ENDPOINT + "?page={}&size={}&sort=-startTime&include-polyline={}"
+
 the_start_time: Final = time.time()
 
 @staticmethod
@@ -59,6 +72,14 @@ def get_timeout():
     else:
         return 60
 
+def get_client_timeout() -> aiohttp.ClientTimeout:
+    # aiohttp's own request timeout - a 'Retry-After' sleep between two requests is not
+    # part of it (like it was with an asyncio.timeout() around the complete request handling).
+    # The timeout is passed per request (and not once to the session), since it depends on
+    # the time since the start of the integration (see get_timeout())
+    total = get_timeout()
+    return aiohttp.ClientTimeout(total=total, connect=total / 2, sock_read=total * 0.8)
+
 class BoschEBikeAPIError(Exception):
     """Base exception for Bosch eBike API errors."""
     def __init__(self, message: str, status_code: int | None = None) -> None:
@@ -73,6 +94,18 @@ class BoschEBikeAuthError(BoschEBikeAPIError):
 class BoschEBikeAIOAPI:
     """API client for Bosch eBike Flow."""
 
+    # the invariant part of the authorization URL query
+    _STATIC_AUTH_PARAMS: Final = urlencode({
+        "client_id": CLIENT_ID,
+        "redirect_uri": REDIRECT_URI,
+        "response_type": "code",
+        "scope": SCOPE,
+        "code_challenge_method": "S256",
+        "kc_idp_hint": "skid",
+        "prompt": "login",
+    })
+    _BASE_HEADERS: Final = {"Content-Type": "application/json"}
+
     def __init__(
         self,
         session: aiohttp.ClientSession
@@ -80,21 +113,21 @@ class BoschEBikeAIOAPI:
         """Initialize the API client."""
         self._aoi_session = session
         self._access_token = None
+        self._bearer: str | None = None
         self._refresh_token = None
         self._token_expires_at: datetime | None = None
+        self._refresh_task: asyncio.Task | None = None
 
     @staticmethod
     def generate_pkce_pair() -> tuple[str, str]:
         """Generate PKCE code verifier and challenge."""
-        # Generate code verifier (43-128 characters)
-        code_verifier = base64.urlsafe_b64encode(
-            secrets.token_bytes(32)
-        ).decode('utf-8').rstrip('=')
+        # Generate code verifier (43-128 characters) - 32 random bytes, url-safe base64 without padding
+        code_verifier = secrets.token_urlsafe(32)
 
         # Generate code challenge
         code_challenge = base64.urlsafe_b64encode(
-            hashlib.sha256(code_verifier.encode('utf-8')).digest()
-        ).decode('utf-8').rstrip('=')
+            hashlib.sha256(code_verifier.encode('ascii')).digest()
+        ).rstrip(b'=').decode('ascii')
 
         return code_verifier, code_challenge
 
@@ -102,22 +135,15 @@ class BoschEBikeAIOAPI:
     def build_auth_url(code_challenge: str) -> str:
         """Build the OAuth authorization URL."""
         # Generate random nonce and state for security
-        nonce = base64.urlsafe_b64encode(secrets.token_bytes(32)).decode('utf-8').rstrip('=')
-        state = base64.urlsafe_b64encode(secrets.token_bytes(32)).decode('utf-8').rstrip('=')
+        nonce = secrets.token_urlsafe(32)
+        state = secrets.token_urlsafe(32)
 
         params = {
-            "client_id": CLIENT_ID,
-            "redirect_uri": REDIRECT_URI,
-            "response_type": "code",
-            "scope": SCOPE,
             "code_challenge": code_challenge,
-            "code_challenge_method": "S256",
-            "kc_idp_hint": "skid",
-            "prompt": "login",
             "nonce": nonce,
             "state": state,
         }
-        return f"{AUTH_URL}?{urlencode(params)}"
+        return f"{AUTH_URL}?{BoschEBikeAIOAPI._STATIC_AUTH_PARAMS}&{urlencode(params)}"
 
     async def exchange_code_for_token(
             self,
@@ -138,32 +164,101 @@ class BoschEBikeAIOAPI:
         }
 
         try:
-            async with timeout(get_timeout()):
-                async with self._aoi_session.post(
-                        TOKEN_URL,
-                        data=data,
-                        headers=headers,
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        _LOGGER.error("BoschEBikeAIOAPI: Token exchange failed: %s - %s", response.status, error_text)
-                        raise BoschEBikeAuthError(f"Token exchange failed ({response.status}): {error_text}")
+            async with self._aoi_session.post(
+                    TOKEN_URL,
+                    data=data,
+                    headers=headers,
+                    timeout=get_client_timeout(),
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    _LOGGER.error("BoschEBikeAIOAPI: Token exchange failed: %s - %s", response.status, error_text)
+                    raise BoschEBikeAuthError(f"Token exchange failed ({response.status}): {error_text}")
+
+                token_data = await response.json(loads=json_loads)
+                self._set_token_data(token_data)
+
+                _LOGGER.debug("BoschEBikeAIOAPI: Successfully exchanged code for tokens")
+                return token_data
 
-                    token_data = await response.json()
+        except aiohttp.ClientError as err:
+            _LOGGER.error("BoschEBikeAIOAPI: Error exchanging code for token: %s", err)
+            raise BoschEBikeAuthError(f"Failed to exchange code: {err}") from err
 
-                    self._access_token = token_data["access_token"]
-                    self._refresh_token = token_data["refresh_token"]
+    def _set_token_data(self, token_data: dict[str, Any]) -> None:
+        self._access_token = token_data["access_token"]
+        self._bearer = f"Bearer {self._access_token}"
+        self._refresh_token = token_data.get("refresh_token", self._refresh_token)
 
-                    # Calculate expiration time
-                    expires_in = token_data.get("expires_in", 7200)  # Default 2 hours
-                    self._token_expires_at = datetime.now() + timedelta(seconds=expires_in)
+        # Calculate expiration time
+        expires_in = token_data.get("expires_in", 7200)  # Default 2 hours
+        self._token_expires_at = datetime.now() + timedelta(seconds=expires_in)
+
+    async def refresh_access_token(self) -> None:
+        """Refresh the access token."""
+        if not self._refresh_token:
+            raise BoschEBikeAuthError("No refresh token available")
+
+        data = {
+            "grant_type": "refresh_token",
+            "client_id": CLIENT_ID,
+            "refresh_token": self._refresh_token,
+        }
+
+        headers = {
+            "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8"
+        }
 
-                    _LOGGER.debug("BoschEBikeAIOAPI: Successfully exchanged code for tokens")
-                    return token_data
+        try:
+            async with self._aoi_session.post(
+                    TOKEN_URL,
+                    data=data,
+                    headers=headers,
+                    timeout=get_client_timeout(),
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    _LOGGER.error("BoschEBikeAIOAPI: Token refresh failed: %s - %s", response.status, error_text)
+                    raise BoschEBikeAuthError(f"Token refresh failed ({response.status}): {error_text}")
+
+                self._set_token_data(await response.json(loads=json_loads))
+                _LOGGER.debug("BoschEBikeAIOAPI: Successfully refreshed tokens")
 
         except aiohttp.ClientError as err:
-            _LOGGER.error("BoschEBikeAIOAPI: Error exchanging code for token: %s", err)
-            raise BoschEBikeAuthError(f"Failed to exchange code: {err}") from err
+            _LOGGER.error("BoschEBikeAIOAPI: Error refreshing token: %s", err)
+            raise BoschEBikeAuthError(f"Failed to refresh token: {err}") from err
+
+    async def _shared_refresh(self) -> None:
+        """Refresh the access token - concurrent callers share the single in-flight refresh
+        (a second refresh would invalidate the refresh token used by the first one)."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self.refresh_access_token())
+            # when all callers have been cancelled, nobody else retrieves the exception
+            self._refresh_task.add_done_callback(self._refresh_done)
+        # a cancelled caller must not cancel the refresh the other callers are waiting for
+        await asyncio.shield(self._refresh_task)
+
+    @staticmethod
+    def _refresh_done(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            # the next request will refresh inline (or run into the 401 handling)
+            _LOGGER.debug("BoschEBikeAIOAPI: Token refresh failed: %s", task.exception())
+
+    async def _ensure_token_valid(self) -> None:
+        """Refresh the access token in the background, when it is about to expire - so
+        requests don't have to pay the 401 round-trip. Only an already expired token is
+        refreshed inline."""
+        if self._token_expires_at is None:
+            return
+
+        remaining = self._token_expires_at - datetime.now()
+        if remaining <= timedelta(0):
+            await self._shared_refresh()
+
+        elif remaining <= timedelta(seconds=TOKEN_REFRESH_BUFFER_SECONDS):
+            if self._refresh_task is None or self._refresh_task.done():
+                self._refresh_task = asyncio.create_task(self.refresh_access_token())
+                self._refresh_task.add_done_callback(self._refresh_done)
 
     async def _aio_api_request(
             self,
@@ -176,39 +271,41 @@ class BoschEBikeAIOAPI:
         if not self._access_token:
             raise BoschEBikeAuthError("No access token available")
 
-        headers = kwargs.pop("headers", {})
-        headers.update({
-            "Authorization": f"Bearer {self._access_token}",
-            "Content-Type": "application/json",
-        })
+        await self._ensure_token_valid()
+
+        headers = {**self._BASE_HEADERS, **kwargs.pop("headers", {}), "Authorization": self._bearer}
 
         url = f"{base}{endpoint}"
 
         try:
-            async with timeout(get_timeout()):
-                async with self._aoi_session.request(
-                        method,
-                        url,
-                        headers=headers,
-                        **kwargs,
-                ) as response:
-                    if response.status == 401:
-                        # Try to refresh token and retry once
-                        _LOGGER.debug("BoschEBikeAIOAPI: Got 401, attempting token refresh")
-                        await self.refresh_access_token()
-
-                        headers["Authorization"] = f"Bearer {self._access_token}"
-                        async with self._aoi_session.request(
-                                method,
-                                url,
-                                headers=headers,
-                                **kwargs,
-                        ) as retry_response:
-                            retry_response.raise_for_status()
-                            return await retry_response.json()
-
-                    response.raise_for_status()
-                    return await response.json()
+            async with self._aoi_session.request(
+                    method,
+                    url,
+                    headers=headers,
+                    timeout=get_client_timeout(),
+                    **kwargs,
+            ) as response:
+                if response.status == 401:
+                    # slow path (token has been revoked?!) - try to refresh token and retry once
+                    _LOGGER.debug("BoschEBikeAIOAPI: Got 401, attempting token refresh")
+                    await self._shared_refresh()
+
+                    headers["Authorization"] = self._bearer
+                    async with self._aoi_session.request(
+                            method,
+                            url,
+                            headers=headers,
+                            timeout=get_client_timeout(),
+                            **kwargs,
+                    ) as retry_response:
+                        if retry_response.status >= 400:
+                            error_text = await retry_response.text()
+                            _LOGGER.error("BoschEBikeAIOAPI: API request still failed after token refresh: %s - %s", retry_response.status, error_text)
+                            raise BoschEBikeAPIError(f"API request failed ({retry_response.status}): {error_text}", retry_response.status)
+                        return await retry_response.json(loads=json_loads)
+
+                response.raise_for_status()
+                return await response.json(loads=json_loads)
 
         except aiohttp.ClientResponseError as err:
             if err.status == 404:
@@ -258,135 +355,183 @@ class BoschEBikeAIOAPI:
 
 class BoschEBikeOAuthAPI:
     """API client for Bosch eBike Flow."""
-    def __init__(self, bin: str, oauth_session: OAuth2Session, log_storage_path: Path | None = None) -> None:
+    def __init__(self, bin: str, oauth_session: OAuth2Session, log_storage_path: Path | None = None, session: aiohttp.ClientSession | None = None) -> None:
         """Initialize the API client."""
         self._bin = bin
         self._oauth_session = oauth_session
+        self._session = session
+        self._dump_storage_path = log_storage_path
+        self._rate_limited_until: float = 0.0
+
+    @property
+    def rate_limit_remaining(self) -> float:
+        """Seconds till the backend will accept requests again (after a 429)."""
+        return max(self._rate_limited_until - time.monotonic(), 0.0)
+
+    @property
+    def log_storage_path(self) -> Path | None:
+        return self._dump_storage_path
+
+    @log_storage_path.setter
+    def log_storage_path(self, log_storage_path: Path | None) -> None:
         self._dump_storage_path = log_storage_path
 
     async def _oauth_api_request(self, log_type: str, method: str, endpoint: str, base: str = PROFILE_API_BASE_URL, **kwargs: Any) -> dict[str, Any]:
         url = f"{base}{endpoint}"
+        if time.monotonic() < self._rate_limited_until:
+            _LOGGER.debug("_oauth_api_request_%s():%s skipped - still rate limited", method, url)
+            raise BoschEBikeAPIError(f"Rate limited - skipped request to {url}", 429)
+
         for attempt in range(2):
             try:
-                async with timeout(get_timeout()):
-                    headers = kwargs.pop("headers", {})
-                    headers.update({"Content-Type": "application/json"})
-                    res = await self._oauth_session.async_request(method=method, headers=headers, url=url)
+                headers = kwargs.pop("headers", {})
+                headers.update({"Content-Type": "application/json"})
+                if self._session is not None:
+                    # the OAuth2Session is only used to provide a valid token - the request
+                    # itself is made via the shared (keep-alive) session of HA
+                    await self._oauth_session.async_ensure_token_valid()
+                    headers["Authorization"] = f"Bearer {self._oauth_session.token['access_token']}"
+                    res = await self._session.request(method, url, headers=headers, timeout=get_client_timeout())
+                else:
+                    res = await self._oauth_session.async_request(method=method, headers=headers, url=url, timeout=get_client_timeout())
+                # the response (connection) is released, even when we fail before reading the body
+                async with res:
                     try:
                         res.raise_for_status()
-                        response_data = await res.json()
+                        # orjson can parse the raw bytes - no need to decode the body to a str first
+                        body = await res.read()
+                        response_data = json_loads(body) if len(body) > 0 else None
                         if response_data is not None:
-                            _LOGGER.debug(f"_oauth_api_request_{method}(): {len(response_data)} - {response_data.keys() if response_data is not None else 'None'}")
+                            if _LOGGER.isEnabledFor(logging.DEBUG):
+                                _LOGGER.debug("_oauth_api_request_%s(): %s - %s", method, len(response_data), response_data.keys())
 
                             if self._dump_storage_path is not None:
                                 try:
                                     await asyncio.get_running_loop().run_in_executor(None, lambda: self.__dump_data(log_type, response_data))
                                 except BaseException as e:
-                                    _LOGGER.debug(f"_oauth_api_request_{method}(): Error while dumping {log_type} data to file: {type(e).__name__} - {e}")
+                                    _LOGGER.debug("_oauth_api_request_%s(): Error while dumping %s data to file: %s - %s", method, log_type, type(e).__name__, e)
 
                         else:
-                            _LOGGER.debug(f"_oauth_api_request_{method}(): No data received!")
+                            _LOGGER.debug("_oauth_api_request_%s(): No data received!", method)
 
                         return response_data
 
                     except aiohttp.ClientResponseError as err:
                         if err.status == 429:
-                            if attempt == 0:
-                                retry_after = err.headers.get("Retry-After") if err.headers else None
+                            retry_after = err.headers.get("Retry-After") if err.headers else None
+                            try:
                                 delay = float(retry_after) if retry_after else 30
-                                _LOGGER.debug(f"_oauth_api_request_{method}():{url} caused 429 - rate limit exceeded - sleeping {delay}s before retrying once")
+                            except ValueError:
+                                # 'Retry-After' can also be an HTTP date
+                                delay = 30
+
+                            # all other requests (of this client) will not even try till the backend
+                            # accepts requests again - only a short 'Retry-After' is waited for within
+                            # this request (a longer one is left to the next coordinator update)
+                            self._rate_limited_until = time.monotonic() + delay
+                            if attempt == 0 and delay <= get_timeout():
+                                _LOGGER.debug("_oauth_api_request_%s():%s caused 429 - rate limit exceeded - sleeping %ss before retrying once", method, url, delay)
+                                # the connection is not needed while we are waiting
+                                res.release()
                                 await asyncio.sleep(delay)
                                 # retry/next attempt
                                 continue
                             else:
-                                _LOGGER.warning(f"_oauth_api_request_{method}():{url} still rate limited after retry - giving up for this cycle")
-                                return {}
+                                _LOGGER.warning("_oauth_api_request_%s():%s rate limited (retry after %ss) - giving up for this cycle", method, url, delay)
+                                raise BoschEBikeAPIError(f"API request failed: {err}", err.status) from err
 
                         elif err.status == 404:
-                            _LOGGER.debug(f"_oauth_api_request_{method}(): Resource not found (404): {endpoint}")
+                            _LOGGER.debug("_oauth_api_request_%s(): Resource not found (404): %s", method, endpoint)
                         else:
-                            _LOGGER.error(f"_oauth_api_request_{method}(): API request error: {type(err).__name__} {err}")
+                            _LOGGER.error("_oauth_api_request_%s(): API request error: %s %s", method, type(err).__name__, err)
                         raise BoschEBikeAPIError(f"API request failed: {err}", err.status) from err
 
                     except aiohttp.ClientError as err:
-                        _LOGGER.error(f"_oauth_api_request_{method}(): Connection error: {type(err).__name__} {err}")
+                        _LOGGER.error("_oauth_api_request_%s(): Connection error: %s %s", method, type(err).__name__, err)
                         raise BoschEBikeAPIError(f"Connection failed: {err}") from err
 
                     except BaseException as err:
-                        _LOGGER.info(f"_oauth_api_request_{method}():{url} caused {type(err).__name__} {err}")
+                        _LOGGER.info("_oauth_api_request_%s():%s caused %s %s", method, url, type(err).__name__, err)
                         return None
 
             # except OAuth2TokenRequestReauthError as err:
-            #     _LOGGER.warning(f"_oauth_api_request_{method}(): OAuth token refresh failed - reauthentication required: {err}")
+            #     _LOGGER.warning("_oauth_api_request_%s(): OAuth token refresh failed - reauthentication required: %s", method, err)
             #     raise BoschEBikeAuthError(f"OAuth token refresh failed: {err}") from err
             except asyncio.TimeoutError as err:
-                _LOGGER.error(f"_oauth_api_request_{method}(): Timeout error: {type(err).__name__} {err}")
+                _LOGGER.error("_oauth_api_request_%s(): Timeout error: %s %s", method, type(err).__name__, err)
                 raise BoschEBikeAPIError(f"TimeoutError: {err}") from err
             except aiohttp.ClientResponseError as err:
-                _LOGGER.error(f"_oauth_api_request_{method}(): ClientResponse error: {type(err).__name__} {err}")
+                _LOGGER.error("_oauth_api_request_%s(): ClientResponse error: %s %s", method, type(err).__name__, err)
                 raise BoschEBikeAPIError(f"ClientResponseError: {err}", err.status) from err
             except aiohttp.ClientError as err:
-                _LOGGER.error(f"_oauth_api_request_{method}(): Client error: {type(err).__name__} {err}")
+                _LOGGER.error("_oauth_api_request_%s(): Client error: %s %s", method, type(err).__name__, err)
                 raise BoschEBikeAPIError(f"ClientError: {err}") from err
 
         return None
 
-    async def get_subscription_status(self) -> dict[str, Any]:
+    async def get_subscription_status(self) -> bool | None:
+        """Get the 'Flow'-subscription status - None, if the status could not be fetched."""
         try:
-            _LOGGER.debug(f"get_subscription_status(): Fetching subscription status")
+            _LOGGER.debug("get_subscription_status(): Fetching subscription status")
             response = await self._oauth_api_request(
                 "purchase",
                 "GET",
                 endpoint = IN_APP_PURCHASE_ENDPOINT_STATE,
                 base = IN_APP_PURCHASE_API_BASE_URL
             )
-            return response is not None and response.get("status", False)
+            if not isinstance(response, dict) or "status" not in response:
+                # no (valid) payload - this must not be taken as 'no subscription'
+                _LOGGER.debug("get_subscription_status(): no status in response: %s", response)
+                return None
+
+            return bool(response["status"])
 
         except BoschEBikeAuthError:
             raise
         except BaseException as err:
-            _LOGGER.warning(f"get_subscription_status(): Fetching subscription status caused {type(err).__name__} - {err} - assuming no subscription")
-            return False
+            _LOGGER.warning("get_subscription_status(): Fetching subscription status caused %s - %s - assuming no subscription", type(err).__name__, err)
+            return None
 
 
     async def get_bike_profile(self, bike_id: str) -> dict[str, Any] | None:
         """Get detailed bike profile."""
         try:
-            _LOGGER.debug(f"get_bike_profile(): Fetching bike profile for {bike_id}",)
+            _LOGGER.debug("get_bike_profile(): Fetching bike profile for %s", bike_id)
             response = await self._oauth_api_request(
                 "profile",
                 "GET",
-                f"{PROFILE_ENDPOINT_BIKE_PROFILE_V2}/{bike_id}"
+                _BIKE_PROFILE_V2_PREFIX + bike_id
             )
             # make sure that V1 and V2 are compatible with each other...
             # (V1 wraps the payload in data.attributes, V2 returns it flat)
-            if response and "data" in response and "attributes" in response["data"]:
-                response = response["data"]["attributes"]
+            data = response.get("data") if response else None
+            if isinstance(data, dict) and "attributes" in data:
+                response = data["attributes"]
 
             return response
 
         except BoschEBikeAuthError:
             raise
         except BaseException as err:
-            _LOGGER.warning(f"get_bike_profile(): Fetching bike profile data caused {type(err).__name__} - {err}")
+            _LOGGER.warning("get_bike_profile(): Fetching bike profile data caused %s - %s", type(err).__name__, err)
             return None
 
 
     async def get_state_of_charge(self, bike_id: str) -> dict[str, Any] | None:
         """Get state of charge data from ConnectModule."""
-        _LOGGER.debug(f"get_state_of_charge(): Fetching state of charge for {bike_id}")
+        _LOGGER.debug("get_state_of_charge(): Fetching state of charge for %s", bike_id)
         try:
             response = await self._oauth_api_request(
                 "charge",
                 "GET",
-                f"{PROFILE_ENDPOINT_STATE_OF_CHARGE}/{bike_id}"
+                _STATE_OF_CHARGE_PREFIX + bike_id
             )
             return response
 
         except BoschEBikeAPIError as err:
             if err.status_code == 404:
                 # 404 is expected when bike is offline
-                _LOGGER.debug(f"get_state_of_charge(): Live state-of-charge not available (bike offline?)")
+                _LOGGER.debug("get_state_of_charge(): Live state-of-charge not available (bike offline?)")
                 return None
             else:
                 raise err
@@ -395,11 +540,11 @@ class BoschEBikeOAuthAPI:
     async def get_bcm_registrations(self, bike_id: str) -> dict[str, Any] | None:
         """Get the ConnectModule (BCM) registrations for a bike from the theft-detection service."""
         try:
-            _LOGGER.debug(f"get_bcm_registrations(): Fetching BCM registrations for {bike_id}")
+            _LOGGER.debug("get_bcm_registrations(): Fetching BCM registrations for %s", bike_id)
             response = await self._oauth_api_request(
                 "registrations",
                 "GET",
-                f"{THEFT_DETECTION_ENDPOINT_REGISTRATIONS}?bikeId={bike_id}",
+                _BCM_REGISTRATIONS_PREFIX + bike_id,
                 THEFT_DETECTION_API_BASE_URL
             )
             return response
@@ -407,18 +552,18 @@ class BoschEBikeOAuthAPI:
         except BoschEBikeAuthError:
             raise
         except BaseException as err:
-            _LOGGER.debug(f"get_bcm_registrations(): Fetching BCM registrations caused {type(err).__name__} - {err} - assuming no BCM registration")
+            _LOGGER.debug("get_bcm_registrations(): Fetching BCM registrations caused %s - %s - assuming no BCM registration", type(err).__name__, err)
             return None
 
 
     async def get_latest_locations(self, bike_id: str) -> dict[str, Any] | None:
         """Get the last known location(s) of a bike from the theft-detection service."""
-        _LOGGER.debug(f"get_latest_locations(): Fetching latest locations for {bike_id}")
+        _LOGGER.debug("get_latest_locations(): Fetching latest locations for %s", bike_id)
         try:
             response = await self._oauth_api_request(
                 "locations",
                 "GET",
-                f"{THEFT_DETECTION_ENDPOINT_LATEST_LOCATIONS}?bikeId={bike_id}",
+                _BCM_LATEST_LOCATIONS_PREFIX + bike_id,
                 THEFT_DETECTION_API_BASE_URL
             )
             return response
@@ -426,7 +571,7 @@ class BoschEBikeOAuthAPI:
         except BoschEBikeAPIError as err:
             if err.status_code == 404:
                 # 404 is expected when no location has been reported (yet)
-                _LOGGER.debug(f"get_latest_locations(): No location available for {bike_id}")
+                _LOGGER.debug("get_latest_locations(): No location available for %s", bike_id)
                 return None
             else:
                 raise err
@@ -435,81 +580,113 @@ class BoschEBikeOAuthAPI:
     async def get_activity_list_recent(self, bike_id:str, size:int=30) -> list[dict[str, Any]]:
         """Get the last recent activity list for a bike."""
         _LOGGER.debug(f"get_activity_list_recent(): Fetching recent activity list for bike {bike_id}")
-        activities_by_id: dict[str, dict[str, Any]] = {}
+        response = await self._fetch_activity_page(0, size, True)
+        if not response:
+            return []
+
+        return self._get_page_activities(bike_id, response, set())
+
+    async def _fetch_activity_page(self, page:int, page_size:int, include_polyline:bool) -> dict[str, Any] | None:
+        _LOGGER.debug("_fetch_activity_page(): Fetching activity page %s", page)
         try:
-            response = await self._oauth_api_request(
+            # Construct the endpoint with pagination parameters
+            return await self._oauth_api_request(
                 "activities",
                 "GET",
-                f"{ACTIVITIES_ENDPOINT}?page=0&size={size}&sort=-startTime&include-polyline=true",
-                ACTIVITY_API_BASE_URL
+                _ACTIVITIES_PAGE_QUERY.format(page, page_size, "true" if include_polyline else "false"),
+                base=ACTIVITY_API_BASE_URL
             )
-            if not response:
-                return []
-
-            page_items = response.get("data", [])
-            for item in page_items:
-                activity_id = item.get("id")
-                if activity_id:
-                    if activity_id not in activities_by_id:
-                        if item.get("attributes", {}).get("bikeId") == bike_id:
-                            activities_by_id[activity_id] = item
-                    else:
-                        _LOGGER.warning(f"get_activity_list_recent(): Duplicate activity ID {activity_id} found, skipping it")
-
-            return list(activities_by_id.values())
-
         except BoschEBikeAuthError:
             raise
-        except BaseException as err:
-            _LOGGER.warning(f"get_activity_list_recent(): Fetching activity data caused {type(err).__name__} - {err}")
-            return []
-
+        except Exception as err:
+            # a CancelledError is not caught here - it must be propagated
+            _LOGGER.warning("_fetch_activity_page(): getting activity data caused %s - %s", type(err).__name__, err)
+            return None
 
-    async def get_activity_list_complete(self, bike_id:str) -> list[dict[str, Any]]:
-        """Fetch all activities by iterating through all available pages."""
-        activities_by_id: dict[str, dict[str, Any]] = {}
+    @staticmethod
+    def _get_page_activities(bike_id:str, response: dict[str, Any], seen_activity_ids: set[str]) -> list[dict[str, Any]]:
+        # Add activities from the current page to our list
+        # Assuming activities are in a 'data' or 'items' key based on standard Bosch API patterns
+        page_activities = []
+        for item in response.get("data", []):
+            # activities of other bikes are skipped first (before any further lookups)
+            attributes = item.get("attributes")
+            if attributes is None or attributes.get("bikeId") != bike_id:
+                continue
+
+            activity_id = item.get("id")
+            if not activity_id:
+                continue
+
+            if activity_id in seen_activity_ids:
+                _LOGGER.warning(f"_get_page_activities(): Duplicate activity ID {activity_id} found, skipping it")
+                continue
+
+            seen_activity_ids.add(activity_id)
+            page_activities.append(item)
+        return page_activities
+
+    async def get_activity_list_paginated(self, bike_id:str, page_size:int=30, include_polyline:bool=False) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """Yield the activities of a bike page by page (most recent first).
+
+        The caller can stop iterating as soon as it has found what it is looking for - so
+        the remaining pages will never be requested from the Bosch backend. The polylines
+        (include_polyline) are only requested for the first (most recent) page.
+
+        When a page could not be fetched, BoschEBikeAPIError is raised - so a failed page
+        can't be mistaken for the end of the activity history.
+        """
+        seen_activity_ids: set[str] = set()
         current_page = 0
         total_pages = 1  # Start with 1 to enter the loop
 
         while current_page < total_pages:
-            _LOGGER.debug(f"get_activity_list_complete(): Fetching activity page {current_page}")
-
-            try:
-                # Construct the endpoint with pagination parameters
-                response = await self._oauth_api_request(
-                    "activities",
-                    "GET",
-                    f"{ACTIVITIES_ENDPOINT}?page={current_page}&size=30&sort=-startTime&include-polyline=false",
-                    base=ACTIVITY_API_BASE_URL
-                )
-            except BoschEBikeAuthError:
-                raise
-            except BaseException as err:
-                _LOGGER.warning(f"get_activity_list_complete(): getting full activity data caused {type(err).__name__} - {err}")
-                response = None
-
+            response = await self._fetch_activity_page(current_page, page_size, include_polyline and current_page == 0)
             if not response:
-                break
-
-            # Add activities from the current page to our list
-            # Assuming activities are in a 'data' or 'items' key based on standard Bosch API patterns
-            page_items = response.get("data", [])
-            for item in page_items:
-                activity_id = item.get("id")
-                if activity_id:
-                    if activity_id not in activities_by_id:
-                        if item.get("attributes", {}).get("bikeId") == bike_id:
-                            activities_by_id[activity_id] = item
-                    else:
-                        _LOGGER.warning(f"get_activity_list_complete(): Duplicate activity ID {activity_id} found, skipping it")
+                raise BoschEBikeAPIError(f"Activity page {current_page} could not be fetched")
+
+            page_activities = self._get_page_activities(bike_id, response, seen_activity_ids)
 
             # Update pagination info from the meta block
             meta = response.get("meta", {})
             total_pages = meta.get("pages", 0)
             current_page += 1
-            _LOGGER.debug(f"get_activity_list_complete(): Progress: {current_page}/{total_pages} pages collected")
+            _LOGGER.debug(f"get_activity_list_paginated(): Progress: {current_page}/{total_pages} pages collected")
+
+            yield page_activities
+
+
+    async def get_activity_list_complete(self, bike_id:str, page_size:int=30, include_polyline:bool=False) -> list[dict[str, Any]]:
+        """Fetch all activities of a bike - after the first page (that includes the total
+        number of pages) all other pages are requested concurrently.
+
+        When a page could not be fetched, BoschEBikeAPIError is raised (an incomplete list
+        would leave a gap in the imported activities).
+        """
+        response = await self._fetch_activity_page(0, page_size, include_polyline)
+        if not response:
+            raise BoschEBikeAPIError("Activity page 0 could not be fetched")
+
+        seen_activity_ids: set[str] = set()
+        activities = self._get_page_activities(bike_id, response, seen_activity_ids)
+
+        total_pages = response.get("meta", {}).get("pages", 0)
+        if total_pages > 1:
+            # do not flood the Bosch backend with the requests of a long ride history
+            semaphore = asyncio.Semaphore(5)
+
+            async def _fetch_page(page: int) -> dict[str, Any] | None:
+                async with semaphore:
+                    return await self._fetch_activity_page(page, page_size, include_polyline)
+
+            responses = await asyncio.gather(*(_fetch_page(page) for page in range(1, total_pages)))
+            for page, page_response in enumerate(responses, start=1):
+                if not page_response:
+                    raise BoschEBikeAPIError(f"Activity page {page} could not be fetched")
+                activities.extend(self._get_page_activities(bike_id, page_response, seen_activity_ids))
 
-        return list(activities_by_id.values())
+        _LOGGER.debug(f"get_activity_list_complete(): {len(activities)} activities collected from {total_pages} pages")
+        return activities
 
 
     async def get_bike_pass(self, bike_id: str) -> dict[str, Any] | None:
@@ -574,9 +751,8 @@ class BoschEBikeOAuthAPI:
                                                    f"{a_datetime.day:02d}", f"{a_datetime.hour:02d}",
                                                    f"{a_datetime.strftime('%Y-%m-%d_%H-%M-%S.%f')[:-3]}_{log_type}.json"))
         try:
-            directory = os.path.dirname(filename)
-            if not os.path.exists(directory):
-                os.makedirs(directory)
+            # this is always running in the executor (never inside the event loop)
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
 
             #file_path = os.path.join(os.getcwd(), filename)
             with open(filename, "w", encoding="utf-8") as outfile:
@@ -4,7 +4,7 @@ import logging
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import BoschEBikeDataUpdateCoordinator, BoschEBikeEntity, KEY_COORDINATOR
@@ -12,15 +12,17 @@ from .const import DOMAIN, BINARY_SENSORS, BoschEBikeBinarySensorEntityDescripti
 
 _LOGGER = logging.getLogger(__name__)
 
+# all updates are made by the coordinator
+PARALLEL_UPDATES = 0
+
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
     """Set up Bosch eBike binary sensors from a config entry."""
     coordinator: BoschEBikeDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id][KEY_COORDINATOR]
-    entities = [
+    async_add_entities(
         BoschEBikeBinarySensor(coordinator, description)
         for description in BINARY_SENSORS
-    ]
-    async_add_entities(entities)
+    )
 
 
 class BoschEBikeBinarySensor(BoschEBikeEntity, BinarySensorEntity):
@@ -28,22 +30,26 @@ class BoschEBikeBinarySensor(BoschEBikeEntity, BinarySensorEntity):
     def __init__(self, coordinator: BoschEBikeDataUpdateCoordinator, description: BoschEBikeBinarySensorEntityDescription) -> None:
         """Initialize the binary sensor."""
         super().__init__(entity_type=Platform.BINARY_SENSOR, coordinator=coordinator, description=description)
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return the state of the binary sensor."""
-        if self.coordinator.data is None:
+        self._value_fn = description.value_fn
+        # state changes of the charging related sensors are logged
+        self._log_state_changes = description.key in ("charger_connected", "battery_charging")
+        # the value is only calculated once per coordinator update (and not on every read)
+        self._attr_is_on = self._calculate_is_on()
+
+    def _calculate_is_on(self) -> bool | None:
+        data = self.coordinator.data
+        if data is None or self._value_fn is None:
             return None
+        return self._value_fn(data)
 
-        if hasattr(self.entity_description, "value_fn") and self.entity_description.value_fn is not None:
-            value = self.entity_description.value_fn(self.coordinator.data)
-
-            # Log state changes for critical sensors
-            if self.entity_description.key in ("charger_connected", "battery_charging"):
-                if not hasattr(self, "_last_logged_state") or self._last_logged_state != value:
-                    _LOGGER.debug(f"Binary sensor {self.entity_description.key} state: {value} (previous: {getattr(self, '_last_logged_state', 'unknown')})")
-                    self._last_logged_state = value
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        value = self._calculate_is_on()
 
-            return value
+        # Log state changes for critical sensors
+        if self._log_state_changes and self._attr_is_on != value:
+            _LOGGER.debug("Binary sensor %s state: %s (previous: %s)", self.entity_description.key, value, self._attr_is_on)
 
-        return None
\ No newline at end of file
+        self._attr_is_on = value
+        super()._handle_coordinator_update()
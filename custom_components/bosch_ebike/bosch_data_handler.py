@@ -14,13 +14,11 @@ KEY_LOCATION: Final = "location"
 @staticmethod
 def build_bike_name_from_api_profile_v1_endpoint(bike: dict[str, Any]) -> str:
     """Build a descriptive bike name from bike data."""
-    attrs = bike.get("attributes", {})
-    brand_name = attrs.get("brandName", "eBike")
-    drive_unit = attrs.get("driveUnit", {})
-    drive_unit_name = drive_unit.get("productName")
+    brand_name = _deep_get(bike, "attributes", "brandName") or "eBike"
+    drive_unit_name = _deep_get(bike, "attributes", "driveUnit", "productName")
 
     # Try to get frame number for uniqueness
-    frame_number = attrs.get("frameNumber")
+    frame_number = _deep_get(bike, "attributes", "frameNumber")
 
     if drive_unit_name:
         # e.g., "Cube (Performance CX)"
@@ -33,15 +31,44 @@ def build_bike_name_from_api_profile_v1_endpoint(bike: dict[str, Any]) -> str:
         return brand_name
 
 
+@staticmethod
+def _deep_get(data: dict[str, Any] | None, *path: str) -> Any:
+    """Walk the nested dicts along the given keys - None, as soon as a key is missing (without
+    allocating empty fallback dicts for each level)."""
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+        if data is None:
+            return None
+    return data
+
 @staticmethod
 def _get_drive_unit(data: dict[str, Any]) -> dict[str, Any]:
     """Extract drive unit data from bike data."""
-    return data.get(KEY_PROFILE, {}).get("driveUnit") or {}
+    return _deep_get(data, KEY_PROFILE, "driveUnit") or {}
+
+@staticmethod
+def _get_assist_mode_ranges(data: dict[str, Any]) -> list[int]:
+    """The reachable ranges of all assist modes (from the bike profile) - highest range first."""
+    modes = _deep_get(data, KEY_PROFILE, "driveUnit", "driveUnitAssistModes")
+    if not isinstance(modes, list):
+        return []
+
+    # entries without a (numeric) 'reachableRange' must not break the remaining ones
+    ranges = []
+    for item in modes:
+        if isinstance(item, dict):
+            try:
+                ranges.append(int(item.get("reachableRange")))
+            except (TypeError, ValueError):
+                pass
+    return sorted(ranges, reverse=True)
 
 @staticmethod
 def _get_first_battery(data: dict[str, Any]) -> dict[str, Any]:
     """Extract first battery data from bike data."""
-    batteries = data.get(KEY_PROFILE, {}).get("batteries", [])
+    batteries = _deep_get(data, KEY_PROFILE, "batteries")
     return batteries[0] if batteries else {}
 
 @staticmethod
@@ -57,9 +84,7 @@ def get_battery_reachable_min_range(data: dict[str, Any]):
         elif isinstance(reachable_range_raw, (int, float)):
             return reachable_range_raw
     else:
-        ranges = sorted(
-            [int(item["reachableRange"]) for item in _get_drive_unit(data).get("driveUnitAssistModes", {})],
-            reverse=True)
+        ranges = _get_assist_mode_ranges(data)
         if ranges:
             for x in reversed(ranges):
                 if x != 0:
@@ -77,9 +102,7 @@ def get_battery_reachable_max_range(data: dict[str, Any]):
         elif isinstance(reachable_range_raw, (int, float)):
             return reachable_range_raw
     else:
-        ranges = sorted(
-            [int(item["reachableRange"]) for item in _get_drive_unit(data).get("driveUnitAssistModes", {})],
-            reverse=True)
+        ranges = _get_assist_mode_ranges(data)
         if ranges:
             return ranges[0]
     return None
@@ -110,8 +133,7 @@ def get_lock_enabled(data: dict[str, Any]):
 
 @staticmethod
 def get_alarm_enabled(data: dict[str, Any]):
-    connected_module = data.get(KEY_PROFILE, {}).get("connectedModule") or {}
-    return connected_module.get("isAlarmFeatureEnabled")
+    return _deep_get(data, KEY_PROFILE, "connectedModule", "isAlarmFeatureEnabled")
 
 @staticmethod
 def get_battery_level(data: dict[str, Any]):
@@ -143,16 +165,24 @@ def get_total_distance(data: dict[str, Any]):
         a_val = _get_drive_unit(data).get("totalDistanceTraveled", None)
 
     if a_val is not None:
-        return round(a_val / 1000, 2)
+        return _to_kilo(a_val)
     return None
 
+@staticmethod
+def _to_kilo(a_val: int | float) -> float:
+    """Convert m->km or Wh->kWh (with two decimals)."""
+    if isinstance(a_val, int) and a_val >= 0:
+        # integer math is exact (and rounds .5 always up)
+        return (a_val + 5) // 10 / 100
+    return round(a_val / 1000, 2)
+
 @staticmethod
 def get_charge_cycles(data: dict[str, Any]):
-    return _get_first_battery(data).get("numberOfFullChargeCycles", {}).get("total")
+    return _deep_get(_get_first_battery(data), "numberOfFullChargeCycles", "total")
 
 @staticmethod
 def get_charge_cycles_attr(data: dict[str, Any]):
-    cycles = _get_first_battery(data).get("numberOfFullChargeCycles", {})
+    cycles = _get_first_battery(data).get("numberOfFullChargeCycles") or {}
 
     attrs = {}
     val_on_bike = cycles.get("onBike")
@@ -169,23 +199,21 @@ def get_charge_cycles_attr(data: dict[str, Any]):
 def get_lifetime_energy_delivered(data: dict[str, Any]):
     a_val = _get_first_battery(data).get("deliveredWhOverLifetime")
     if a_val:
-        return round(a_val / 1000, 2)
+        return _to_kilo(a_val)
     return None
 
 @staticmethod
 def get_motor_hours(data: dict[str, Any]):
-    power_on_time = _get_drive_unit(data).get("powerOnTime") or {}
-    return power_on_time.get("total")
+    return _deep_get(data, KEY_PROFILE, "driveUnit", "powerOnTime", "total")
 
 @staticmethod
 def get_motor_hours_attr(data: dict[str, Any]):
-    power_on_time = _get_drive_unit(data).get("powerOnTime") or {}
-    val_with_motor_support = power_on_time.get("withMotorSupport")
+    val_with_motor_support = _deep_get(data, KEY_PROFILE, "driveUnit", "powerOnTime", "withMotorSupport")
     return {"withMotorSupport": val_with_motor_support} if val_with_motor_support is not None else None
 
 @staticmethod
 def get_drive_unit_software_version(data: dict[str, Any]):
-    return _get_drive_unit(data).get("softwareVersion")
+    return _deep_get(data, KEY_PROFILE, "driveUnit", "softwareVersion")
 
 @staticmethod
 def get_battery_software_version(data: dict[str, Any]):
@@ -193,24 +221,22 @@ def get_battery_software_version(data: dict[str, Any]):
 
 @staticmethod
 def get_connected_module_software_version(data: dict[str, Any]):
-    connected_module = data.get(KEY_PROFILE, {}).get("connectedModule") or {}
-    return connected_module.get("softwareVersion")
+    return _deep_get(data, KEY_PROFILE, "connectedModule", "softwareVersion")
 
 @staticmethod
 def get_remote_control_software_version(data: dict[str, Any]):
-    remote_control = data.get(KEY_PROFILE, {}).get("remoteControl") or {}
-    return remote_control.get("softwareVersion")
+    return _deep_get(data, KEY_PROFILE, "remoteControl", "softwareVersion")
 
 @staticmethod
 def _get_last_ride(data: dict[str, Any]) -> dict[str, Any]:
     """Extract the attributes of the most recent activity."""
-    return (data.get(KEY_ACTIVITY) or {}).get("attributes") or {}
+    return _deep_get(data, KEY_ACTIVITY, "attributes") or {}
 
 @staticmethod
 def get_last_ride_distance(data: dict[str, Any]):
     a_val = _get_last_ride(data).get("distance")
     if a_val:
-        return round(a_val / 1000, 2)
+        return _to_kilo(a_val)
     return None
 
 last_ride_dist_attrs = ["timeZoneOfActivity", "durationWithoutStops", "title", "activityType",
@@ -254,7 +280,7 @@ def get_last_ride_distance_attr(data: dict[str, Any]):
 
     start_odometer = ride.get("startOdometer")
     if start_odometer:
-        attrs["startOdometer"] = round(start_odometer / 1000, 2)
+        attrs["startOdometer"] = _to_kilo(start_odometer)
 
     # we want a certain order of the attributes (YES that's quite silly - but I am human!)
     for attr in last_ride_dist_attrs:
@@ -274,7 +300,7 @@ def get_last_ride_distance_attr(data: dict[str, Any]):
 @staticmethod
 def _get_latest_location(data: dict[str, Any]) -> dict[str, Any]:
     """Extract the most recent location entry from the theft-detection data."""
-    locations = (data.get(KEY_LOCATION) or {}).get("locations")
+    locations = _deep_get(data, KEY_LOCATION, "locations")
     if isinstance(locations, list) and len(locations) > 0:
         return locations[0]
     return {}
@@ -314,7 +340,9 @@ def get_battery_reachable_min_max_range_attr(data: dict[str, Any]):
     """
     attrs = {}
     drive_unit = _get_drive_unit(data)
-    assist_modes = drive_unit.get("driveUnitAssistModes", [])
+    assist_modes = drive_unit.get("driveUnitAssistModes")
+    if not isinstance(assist_modes, list):
+        assist_modes = []
 
     # Get the array of reachable ranges from SOC response (preferred)
     reachable_range_array = []
@@ -1,9 +1,11 @@
 """Config flow for Bosch eBike integration."""
+import asyncio
 import logging
+import re
 import time
 from numbers import Number
 from typing import Any, Final
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import unquote_plus
 
 import voluptuous as vol
 
@@ -36,6 +38,30 @@ _LOGGER = logging.getLogger(__name__)
 
 CONF_CODE: Final = "code"
 
+_CODE_PARAM_PATTERN: Final = re.compile(r"[?&]code=([^&#]+)")
+
+_AUTH_SCHEMA: Final = vol.Schema({
+    vol.Required(CONF_CODE): str,
+})
+
+def _as_int(value: Any) -> int | None:
+    """The token lifetimes are (usually) ints - but could also be provided as strings."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+def _extract_authorization_code(code_input: str) -> str | None:
+    authorization_code = code_input.strip()
+
+    # The user might have pasted the complete URL... so we cut out the value of the
+    # 'code' query parameter (no need to parse the complete URL)
+    if "code=" in authorization_code:
+        match = _CODE_PARAM_PATTERN.search(authorization_code)
+        authorization_code = unquote_plus(match.group(1)) if match else None
+
+    return authorization_code
+
 async def _build_bike_pass(bike_id:str, api:BoschEBikeAIOAPI):
     pass_data_src = await api.get_bike_pass(bike_id=bike_id)
     if pass_data_src is not None and pass_data_src.get("frameNumber") is not None:
@@ -55,7 +81,10 @@ class BoschEBikeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         self._code_verifier: str | None = None
         self._code_challenge: str | None = None
+        self._auth_url: str | None = None
         self._bikes: list[dict[str, Any]] = []
+        self._bike_name_by_id: dict[str, str] = {}
+        self._select_bike_schema: vol.Schema | None = None
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -64,8 +93,8 @@ class BoschEBikeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Generate PKCE parameters
         self._code_verifier, self._code_challenge = BoschEBikeAIOAPI.generate_pkce_pair()
 
-        # Build authorization URL
-        auth_url = BoschEBikeAIOAPI.build_auth_url(self._code_challenge)
+        # Build authorization URL (the challenge does not change for the rest of the flow)
+        self._auth_url = BoschEBikeAIOAPI.build_auth_url(self._code_challenge)
 
         # Store for next step
         self.context["code_verifier"] = self._code_verifier
@@ -73,10 +102,8 @@ class BoschEBikeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Show auth URL and ask for code manually
         return self.async_show_form(
             step_id="auth",
-            description_placeholders={"auth_url": auth_url},
-            data_schema=vol.Schema({
-                vol.Required(CONF_CODE): str,
-            }),
+            description_placeholders={"auth_url": self._auth_url},
+            data_schema=_AUTH_SCHEMA,
         )
 
     async def async_step_auth(
@@ -87,23 +114,15 @@ class BoschEBikeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return self.async_abort(reason="missing_code")
 
         # Extract authorization code from user input
-        authorization_code = user_input[CONF_CODE].strip()
-
-        # The user might have pasted the complete URL... so we try to parse it
-        if "code=" in authorization_code:
-            query_params = parse_qs(urlparse(authorization_code).query)
-            if "code" not in query_params:
-                return self.async_abort(reason="missing_code")
-            else:
-                authorization_code = query_params["code"][0]
+        authorization_code = _extract_authorization_code(user_input[CONF_CODE])
+        if authorization_code is None:
+            return self.async_abort(reason="missing_code")
 
         # Get code_verifier from context
         code_verifier = self.context.get("code_verifier")
         if not code_verifier:
             return self.async_abort(reason="missing_verifier")
 
-        errors = {}
-
         try:
             # Exchange code for tokens
             api = BoschEBikeAIOAPI(session=async_get_clientsession(self.hass))
@@ -113,86 +132,95 @@ class BoschEBikeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 code_verifier,
             )
 
-            # we must ensure that 'expires_at' is present...
-            try:
-                token_data[CONF_EXPIRES_IN] = int(token_data[CONF_EXPIRES_IN])
-            except (KeyError, ValueError, TypeError) as err:
-                _LOGGER.warning(f"Error converting {CONF_EXPIRES_IN} to int: {err}")
+            # we must ensure that 'expires_at' is present... (both expiry timestamps are
+            # based on the same 'now' - and must be wall clock time, since the OAuth2Session
+            # of HA compares 'expires_at' with time.time())
+            now = time.time()
+            expires_in = _as_int(token_data.get(CONF_EXPIRES_IN))
+            if expires_in is None:
+                _LOGGER.warning(f"Error converting {CONF_EXPIRES_IN} to int: {token_data.get(CONF_EXPIRES_IN)}")
                 return self.async_abort(reason="oauth_error")
-            token_data[CONF_EXPIRES_AT] = time.time() + token_data[CONF_EXPIRES_IN]
+            token_data[CONF_EXPIRES_IN] = expires_in
+            token_data[CONF_EXPIRES_AT] = now + expires_in
 
             if CONF_REFRESH_EXPIRES_IN in token_data:
-                try:
-                    token_data[CONF_REFRESH_EXPIRES_IN] = int(token_data[CONF_REFRESH_EXPIRES_IN])
-                    if token_data[CONF_REFRESH_EXPIRES_IN] > 0:
-                        token_data[CONF_REFRESH_EXPIRES_AT] = time.time() + token_data[CONF_REFRESH_EXPIRES_IN]
+                refresh_expires_in = _as_int(token_data[CONF_REFRESH_EXPIRES_IN])
+                if refresh_expires_in is None:
+                    _LOGGER.warning(f"Error converting {CONF_REFRESH_EXPIRES_IN} to int: {token_data[CONF_REFRESH_EXPIRES_IN]}")
+                else:
+                    token_data[CONF_REFRESH_EXPIRES_IN] = refresh_expires_in
+                    if refresh_expires_in > 0:
+                        token_data[CONF_REFRESH_EXPIRES_AT] = now + refresh_expires_in
                     else:
                         _LOGGER.info(f"Received an ENDLESS valid refresh token! - *sigh* this is security design of 1986")
-                except ValueError as err:
-                    _LOGGER.warning(f"Error converting {CONF_REFRESH_EXPIRES_IN} to int: {err}")
 
             # Fetch bikes
             self._bikes = await api.get_bikes()
+            self._bike_name_by_id = {
+                bike["id"]: bosch_data_handler.build_bike_name_from_api_profile_v1_endpoint(bike)
+                for bike in self._bikes
+            }
+            self._select_bike_schema = None
 
             if not self._bikes:
                 _LOGGER.error("No bikes found for this account")
-                errors["base"] = "no_bikes"
-
-            if not errors:
-                # Store tokens for next step
-                self.context[OAUTH_TOKEN_KEY] = token_data.copy()
+                errors = {"base": "no_bikes"}
+            else:
+                # Store tokens for next step (token_data is not modified afterwards)
+                self.context[OAUTH_TOKEN_KEY] = token_data
 
                 # If only one bike, auto-select it
                 if len(self._bikes) == 1:
-                    bike = self._bikes[0]
-                    bike_id = bike["id"]
-                    bike_name = bosch_data_handler.build_bike_name_from_api_profile_v1_endpoint(bike)
-                    bike_pass = await _build_bike_pass(bike_id, api)
-
-                    # we must store our captured token data in one object
-                    # with the key `token` (in the config_entry) that will
-                    # be created. Then the OAuth2Session impl can use this
-                    # access_token, refresh_token info later...
-                    entry_data = {
-                        CONF_BIKE_ID: bike_id,
-                        CONF_BIKE_NAME: bike_name,
-                        CONF_BIKE_PASS: bike_pass,
-                        OAUTH_TOKEN_KEY: self.context[OAUTH_TOKEN_KEY]
-                    }
-
-                    # if this bike is already configured, update its tokens instead of
-                    # creating a duplicate entry (also covers the reauth flow, which
-                    # re-enters this same step)
-                    existing_entry = await self.async_set_unique_id(bike_id)
-                    if existing_entry:
-                        return self.async_update_reload_and_abort(existing_entry, data=entry_data)
-                    else:
-                        return self.async_create_entry(title=bike_name, data=entry_data)
+                    bike_id = self._bikes[0]["id"]
+                    return await self._async_create_or_update_entry(bike_id, self._bike_name_by_id[bike_id], api)
                 else:
                     # Multiple bikes - let user choose
                     return await self.async_step_select_bike()
 
         except BoschEBikeAuthError as err:
             _LOGGER.error("Authentication failed: %s", err)
-            errors["base"] = "auth_error"
+            errors = {"base": "auth_error"}
         except BoschEBikeAPIError as err:
             _LOGGER.error("API error: %s", err)
-            errors["base"] = "api_error"
+            errors = {"base": "api_error"}
+        except asyncio.TimeoutError as err:
+            _LOGGER.error("API request timed out: %s", err)
+            errors = {"base": "api_error"}
         except Exception as err:  # pylint: disable=broad-except
             _LOGGER.exception("Unexpected error: %s", err)
-            errors["base"] = "unknown"
+            errors = {"base": "unknown"}
 
-        # Show form again with errors or regenerate auth URL
-        auth_url = BoschEBikeAIOAPI.build_auth_url(self._code_challenge)
+        # Show form again with errors (and the same auth URL)
         return self.async_show_form(
             step_id="auth",
-            description_placeholders={"auth_url": auth_url},
-            data_schema=vol.Schema({
-                vol.Required(CONF_CODE): str,
-            }),
+            description_placeholders={"auth_url": self._auth_url},
+            data_schema=_AUTH_SCHEMA,
             errors=errors,
         )
 
+    async def _async_create_or_update_entry(self, bike_id: str, bike_name: str, api: BoschEBikeAIOAPI) -> FlowResult:
+        bike_pass = await _build_bike_pass(bike_id, api)
+
+        # we must store our captured token data in one object
+        # with the key `token` (in the config_entry) that will
+        # be created. Then the OAuth2Session impl can use this
+        # access_token, refresh_token info later...
+        entry_data = {
+            CONF_BIKE_ID: bike_id,
+            CONF_BIKE_NAME: bike_name,
+            CONF_BIKE_PASS: bike_pass,
+            OAUTH_TOKEN_KEY: self.context.get(OAUTH_TOKEN_KEY)
+        }
+
+        # if this bike is already configured, update its tokens instead of
+        # creating a duplicate entry (also covers the reauth flow, which
+        # re-enters the auth step)
+        existing_entry = await self.async_set_unique_id(bike_id)
+        if existing_entry:
+            return self.async_update_reload_and_abort(existing_entry, data=entry_data)
+        else:
+            return self.async_create_entry(title=bike_name, data=entry_data)
+
     async def async_step_select_bike(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -202,39 +230,21 @@ class BoschEBikeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             bike_id = user_input[CONF_BIKE_ID]
 
             # Find bike details
-            bike = next((b for b in self._bikes if b["id"] == bike_id), None)
-            if not bike:
+            bike_name = self._bike_name_by_id.get(bike_id)
+            if bike_name is None:
                 return self.async_abort(reason="bike_not_found")
 
-            bike_name = bosch_data_handler.build_bike_name_from_api_profile_v1_endpoint(bike)
-            bike_pass = await _build_bike_pass(bike_id, self.context.get("api"))
+            return await self._async_create_or_update_entry(bike_id, bike_name, self.context.get("api"))
 
-            entry_data = {
-                CONF_BIKE_ID: bike_id,
-                CONF_BIKE_NAME: bike_name,
-                CONF_BIKE_PASS: bike_pass,
-                OAUTH_TOKEN_KEY: self.context.get(OAUTH_TOKEN_KEY)
-            }
-
-            # if this bike is already configured, update its tokens instead of
-            # creating a duplicate entry (also covers the reauth flow)
-            existing_entry = await self.async_set_unique_id(bike_id)
-            if existing_entry:
-                return self.async_update_reload_and_abort(existing_entry, data=entry_data)
-            else:
-                return self.async_create_entry(title=bike_name, data=entry_data)
-
-        # Build bike selection options
-        bike_options = {
-            bike["id"]: bosch_data_handler.build_bike_name_from_api_profile_v1_endpoint(bike)
-            for bike in self._bikes
-        }
+        # Build bike selection options (once per bike list)
+        if self._select_bike_schema is None:
+            self._select_bike_schema = vol.Schema({
+                vol.Required(CONF_BIKE_ID): vol.In(self._bike_name_by_id),
+            })
 
         return self.async_show_form(
             step_id="select_bike",
-            data_schema=vol.Schema({
-                vol.Required(CONF_BIKE_ID): vol.In(bike_options),
-            }),
+            data_schema=self._select_bike_schema,
         )
 
 
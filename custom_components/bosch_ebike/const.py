@@ -1,5 +1,5 @@
 """Constants for the Bosch eBike integration."""
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Final, Callable, Any
 
 from homeassistant.components.binary_sensor import BinarySensorEntityDescription, BinarySensorDeviceClass
@@ -54,12 +54,41 @@ THEFT_DETECTION_ENDPOINT_LATEST_LOCATIONS: Final = "/v0/latest-locations"
 # Update intervals
 DEFAULT_SCAN_INTERVAL = 5 # 5minustes
 MIN_SCAN_INTERVAL = 1
+ENTRY_DATA_WRITE_DELAY_SECONDS = 5
+TOKEN_REFRESH_BUFFER_SECONDS = 180
+
+# while the bike is offline (no live state-of-charge available) the scan interval is
+# doubled on every update - up to this maximum (that is also the longest time without a
+# single live state-of-charge request)
+MAX_OFFLINE_SCAN_INTERVAL_MINUTES = 60
+
+# while the battery is charging, the bike is polled at least every n minutes (to follow
+# the rising state-of-charge)
+CHARGING_SCAN_INTERVAL_MINUTES = 2
+
+# while live state-of-charge data is available, the (mostly static) bike profile is only
+# fetched every n (base) scan intervals - so the values that are only part of the profile
+# (lock and alarm state, charge cycles, delivered lifetime energy, motor hours and the
+# software versions) can be up to n scan intervals old. A started/stopped charging and a
+# (dis)connected charger let the next update fetch the profile in any case.
+PROFILE_CACHE_SCAN_INTERVALS = 2
+
+# ...and the live state-of-charge request is only repeated on every 2nd, 4th... update
+# (but at least on every (MAX_SKIPPED_SOC_UPDATES + 1) update)
+MAX_SKIPPED_SOC_UPDATES = 3
 
 # The ConnectModule only reports its position sporadically (charging, powered on,
 # alarm triggered) - so the last-known location is polled less frequently than the
 # regular sensor data
 LOCATION_SCAN_INTERVAL_MINUTES = 20
 
+# on start, the recent activity pages are walked one by one till the last processed activity
+# is found - when it's not part of the first n pages, all pages are fetched concurrently
+MAX_SEQUENTIAL_ACTIVITY_PAGES = 3
+
+# the 'Flow'-subscription status rarely changes - so we only check it once a day
+SUBSCRIPTION_STATUS_CACHE_SECONDS = 86400
+
 TOKEN_REFRESH_INTERVAL = 5400  # 1.5 hours (tokens expire at 2 hours)
 
 # Entity naming
@@ -80,6 +109,7 @@ CONF_BIKE_ID: Final = "bike_id"
 CONF_BIKE_NAME: Final = "bike_name"
 CONF_BIKE_PASS: Final = "bike_pass"
 CONF_LAST_BIKE_ACTIVITY: Final = "last_bike_activity"
+CONF_SUBSCRIPTION_STATUS: Final = "subscription_status"
 CONF_LOG_TO_FILESYSTEM: Final = "log_to_filesystem"
 
 CONF_REFRESH_TOKEN: Final = "refresh_token"
@@ -107,7 +137,14 @@ class BoschEBikeBinarySensorEntityDescription(BinarySensorEntityDescription):
     value_fn: Callable[[dict[str, Any]], bool | None] | None = None
 
 
-BINARY_SENSORS = [
+def _with_translation_keys(*descriptions):
+    """The key of a description is also used as its translation_key (when not set) - this is
+    done once here and not for every created entity."""
+    return tuple(description if description.translation_key is not None else replace(description, translation_key=description.key)
+                 for description in descriptions)
+
+
+BINARY_SENSORS: Final = _with_translation_keys(
     BoschEBikeBinarySensorEntityDescription(
         key="battery_charging",
         device_class=BinarySensorDeviceClass.BATTERY_CHARGING,
@@ -134,9 +171,9 @@ BINARY_SENSORS = [
         value_fn=bosch_data_handler.get_alarm_enabled,
         entity_registry_enabled_default=False,  # Disabled - unreliable, needs investigation
     ),
-]
+)
 
-SENSORS = [
+SENSORS: Final = _with_translation_keys(
     BoschEBikeSensorEntityDescription(
         key="battery_level",
         native_unit_of_measurement=PERCENTAGE,
@@ -263,4 +300,4 @@ SENSORS = [
         value_fn=bosch_data_handler.get_last_ride_distance,
         attr_fn=bosch_data_handler.get_last_ride_distance_attr,
     ),
-]
+)
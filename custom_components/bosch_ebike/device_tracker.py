@@ -13,8 +13,12 @@ from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# all updates are made by the coordinator
+PARALLEL_UPDATES = 0
+
 LOCATION_DESCRIPTION = EntityDescription(
     key="location",
+    translation_key="location",
     icon="mdi:map-marker",
 )
 
@@ -1,6 +1,7 @@
 """Sensor platform for Bosch eBike integration."""
 import logging
-from typing import Any
+from operator import itemgetter
+from typing import Any, Final
 
 from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
 from homeassistant.components.recorder.statistics import async_import_statistics
@@ -8,25 +9,29 @@ from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import dt as dt_util
 
-from . import BoschEBikeDataUpdateCoordinator, BoschEBikeEntity, KEY_COORDINATOR
+from . import BoschEBikeDataUpdateCoordinator, BoschEBikeEntity, KEY_COORDINATOR, SIGNAL_ACTIVITY_LIST_UPDATED, bosch_data_handler
 from .bosch_data_handler import KEY_TOTAL_DISTANCE
 from .const import DOMAIN, CONF_LAST_BIKE_ACTIVITY, SENSORS, BoschEBikeSensorEntityDescription
 
 _LOGGER = logging.getLogger(__name__)
 
+_STATISTIC_START: Final = itemgetter("start")
+
+# all updates are made by the coordinator
+PARALLEL_UPDATES = 0
+
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
     """Set up Bosch eBike sensors from a config entry."""
     coordinator: BoschEBikeDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id][KEY_COORDINATOR]
 
-    entities = [
+    async_add_entities(
         BoschEBikeSensor(coordinator, description, config_entry)
         for description in SENSORS
-    ]
-
-    async_add_entities(entities)
+    )
 
 
 class BoschEBikeSensor(BoschEBikeEntity, SensorEntity):
@@ -35,6 +40,8 @@ class BoschEBikeSensor(BoschEBikeEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(entity_type=Platform.SENSOR, coordinator=coordinator, description=description)
         self._config_entry = config_entry
+        self._value_fn = getattr(description, "value_fn", None)
+        self._attr_fn = getattr(description, "attr_fn", None)
 
     async def async_added_to_hass(self) -> None:
         """Handle entity which will be added."""
@@ -42,36 +49,53 @@ class BoschEBikeSensor(BoschEBikeEntity, SensorEntity):
 
         # we want to try to import the historic states for the 'total_distance' based on the available activities
         if self.entity_description.key == KEY_TOTAL_DISTANCE:
+            # the activity list is fetched by the coordinator in the background - so we
+            # get informed, when there are new activities available
+            self.async_on_remove(async_dispatcher_connect(
+                self.hass,
+                SIGNAL_ACTIVITY_LIST_UPDATED.format(self.coordinator.bike_id),
+                self._import_historical_total_distance_statistics
+            ))
             await self._import_historical_total_distance_statistics()
 
     async def _import_historical_total_distance_statistics(self) -> None:
         """Import historical statistics from an activity list."""
-        if not hasattr(self.coordinator, "activity_list") or not self.coordinator.activity_list or len(self.coordinator.activity_list) == 0:
-            _LOGGER.debug(f"_import_historical_total_distance_statistics(): No NEW activities that must be imported into stats found for: {self.entity_id}")
+        activity_list = getattr(self.coordinator, "activity_list", None)
+        if not activity_list:
+            _LOGGER.debug("_import_historical_total_distance_statistics(): No NEW activities that must be imported into stats found for: %s", self.entity_id)
             return
 
-        _LOGGER.info(f"_import_historical_total_distance_statistics(): Starting historical statistics import of {len(self.coordinator.activity_list)} entries for: {self.entity_id}")
+        _LOGGER.info("_import_historical_total_distance_statistics(): Starting historical statistics import of %s entries for: %s", len(activity_list), self.entity_id)
         statistics = []
-        for activity in self.coordinator.activity_list:
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+        # the activity list can contain the complete ride history - so we bind the functions
+        # that are called per activity once
+        append_statistic = statistics.append
+        utc_from_timestamp = dt_util.utc_from_timestamp
+        for activity in activity_list:
             # ok go though our activities and just get the end date...
-            attributes = activity.get("attributes", {})
+            attributes = activity.get("attributes")
+            if not attributes:
+                continue
             end_timestamp = attributes.get("endTime")
             start_odometer = attributes.get("startOdometer")
             distance = attributes.get("distance")
 
             if end_timestamp and start_odometer is not None and distance is not None:
                 # Calculate odometer at the end of the activity
-                total_dist_km = round((start_odometer + distance) / 1000, 2)
-                # Round down to the start of the hour for HA long-term statistics
-                end_time = dt_util.utc_from_timestamp(end_timestamp).replace(minute=0, second=0, microsecond=0)
-                _LOGGER.debug(f"_import_historical_total_distance_statistics(): Queueing statistic for {total_dist_km} at {end_time.isoformat()}",)
-                statistics.append(StatisticData(start=end_time, state=total_dist_km, sum=total_dist_km))
+                total_dist_km = bosch_data_handler._to_kilo(start_odometer + distance)
+                # Round down to the start of the hour for HA long-term statistics (on the epoch
+                # seconds - so only one datetime is created)
+                end_time = utc_from_timestamp(end_timestamp - end_timestamp % 3600)
+                if debug_enabled:
+                    _LOGGER.debug("_import_historical_total_distance_statistics(): Queueing statistic for %s at %s", total_dist_km, end_time.isoformat())
+                append_statistic(StatisticData(start=end_time, state=total_dist_km, sum=total_dist_km))
 
         if statistics:
             # Sort by time to ensure the recorder processes them in order
-            statistics.sort(key=lambda x: x["start"])
+            statistics.sort(key=_STATISTIC_START)
 
-            _LOGGER.info(f"_import_historical_total_distance_statistics(): Importing {len(statistics)} historical data points - range: {statistics[0]['start'].isoformat()} to {statistics[-1]['start'].isoformat()}")
+            _LOGGER.info("_import_historical_total_distance_statistics(): Importing %s historical data points - range: %s to %s", len(statistics), statistics[0]['start'].isoformat(), statistics[-1]['start'].isoformat())
             metadata = StatisticMetaData(
                 has_sum=True,
                 name=self.name,
@@ -92,27 +116,24 @@ class BoschEBikeSensor(BoschEBikeEntity, SensorEntity):
 
             # update the config entry to indicate that we have imported the statistics up to the
             # most recent activity id that is present @ bosch backends...
-            self.hass.config_entries.async_update_entry(self._config_entry, data={
-                **self._config_entry.data,
-                CONF_LAST_BIKE_ACTIVITY: self.coordinator.activity_list[0].get("id", None)
+            self.coordinator.async_update_entry_data({
+                CONF_LAST_BIKE_ACTIVITY: activity_list[0].get("id", None)
             })
 
     @property
     def extra_state_attributes(self):
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None or self._attr_fn is None:
             return None
 
-        if hasattr(self.entity_description, "attr_fn") and self.entity_description.attr_fn is not None:
-            return self.entity_description.attr_fn(self.coordinator.data)
+        return self._attr_fn(data)
 
 
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None or self._value_fn is None:
             return None
 
-        if hasattr(self.entity_description, "value_fn") and self.entity_description.value_fn is not None:
-            return self.entity_description.value_fn(self.coordinator.data)
-
-        return None
+        return self._value_fn(data)
@@ -0,0 +1,188 @@
+"""Test the paginated activity import without Home Assistant dependencies."""
+# This test file tests the core logic directly without importing Home Assistant modules
+import asyncio
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
+
+import pytest
+
+
+class BoschEBikeAPIError(Exception):
+    """Test version of the API error (with the HTTP status code)."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+MAX_SEQUENTIAL_ACTIVITY_PAGES = 3
+
+
+class PagedActivities:
+    """Mock of the activity pages of the Bosch backend (most recent activity first)."""
+
+    def __init__(self, activity_ids: List[str], page_size: int, failing_page: Optional[int] = None) -> None:
+        self.pages = [activity_ids[i:i + page_size] for i in range(0, len(activity_ids), page_size)]
+        self.failing_page = failing_page
+        # (page, include_polyline) of every sequentially requested page
+        self.requested_pages: List[Tuple[int, bool]] = []
+        self.complete_requested = False
+
+    def _page(self, page: int) -> List[Dict[str, Any]]:
+        return [{"id": activity_id} for activity_id in self.pages[page]] if len(self.pages) > 0 else []
+
+    async def get_activity_list_paginated(self, include_polyline: bool = False) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """Test version of get_activity_list_paginated() (api.py)."""
+        current_page = 0
+        total_pages = 1
+        while current_page < total_pages:
+            self.requested_pages.append((current_page, include_polyline and current_page == 0))
+            if current_page == self.failing_page:
+                raise BoschEBikeAPIError(f"Activity page {current_page} could not be fetched")
+            total_pages = len(self.pages)
+            page_activities = self._page(current_page)
+            current_page += 1
+            yield page_activities
+
+    async def get_activity_list_complete(self) -> List[Dict[str, Any]]:
+        """Mock of get_activity_list_complete() (api.py) - all pages (requested concurrently)."""
+        self.complete_requested = True
+        return [activity for page in range(len(self.pages)) for activity in self._page(page)]
+
+
+async def import_new_activities_logic(backend: PagedActivities, entry_data: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+    """Test version of the paginated walk in int_import_activities() (__init__.py).
+
+    Returns the new activities (None, when the import has been aborted) - and moves the
+    last processed activity in 'entry_data' (like the total distance sensor does after
+    the statistics import).
+    """
+    last_processed_activity = entry_data["last_bike_activity"]
+    try:
+        new_activities = []
+        found = False
+        walked_pages = 0
+        async for page_activities in backend.get_activity_list_paginated(include_polyline=True):
+            idx = next((i for i, a_activity in enumerate(page_activities) if a_activity["id"] == last_processed_activity), None)
+            if idx is not None:
+                new_activities.extend(page_activities[:idx])
+                found = True
+                break
+
+            new_activities.extend(page_activities)
+            walked_pages += 1
+            if walked_pages >= MAX_SEQUENTIAL_ACTIVITY_PAGES:
+                break
+
+        if not found:
+            new_activities = await backend.get_activity_list_complete()
+
+    except BoschEBikeAPIError:
+        return None
+
+    if len(new_activities) > 0:
+        entry_data["last_bike_activity"] = new_activities[0]["id"]
+    return new_activities
+
+
+async def test_import_stops_at_the_last_processed_activity():
+    """The pages after the one with the last processed activity are never requested."""
+    backend = PagedActivities([f"a{i}" for i in range(200)], page_size=30)
+    new_activities = await import_new_activities_logic(backend, {"last_bike_activity": "a35"})
+
+    assert backend.requested_pages == [(0, True), (1, False)]
+    assert backend.complete_requested is False
+    assert [a["id"] for a in new_activities] == [f"a{i}" for i in range(35)]
+
+
+async def test_import_without_new_activities_requests_one_page():
+    """When the last processed activity is still the most recent one, only the first page is requested."""
+    backend = PagedActivities([f"a{i}" for i in range(200)], page_size=30)
+    new_activities = await import_new_activities_logic(backend, {"last_bike_activity": "a0"})
+
+    assert backend.requested_pages == [(0, True)]
+    assert new_activities == []
+
+
+async def test_import_of_an_unknown_activity_fetches_all_pages_concurrently():
+    """An unknown last processed activity (e.g. deleted) does not walk the complete history one by one."""
+    backend = PagedActivities([f"a{i}" for i in range(200)], page_size=30)
+    new_activities = await import_new_activities_logic(backend, {"last_bike_activity": "deleted"})
+
+    assert backend.requested_pages == [(0, True), (1, False), (2, False)]
+    assert backend.complete_requested is True
+    assert len(new_activities) == 200
+
+
+async def test_failed_page_aborts_the_import():
+    """A failed page must not be taken as the end of the history - the import is aborted."""
+    backend = PagedActivities([f"a{i}" for i in range(200)], page_size=30, failing_page=1)
+    entry_data = {"last_bike_activity": "a35"}
+    new_activities = await import_new_activities_logic(backend, entry_data)
+
+    assert new_activities is None
+    assert backend.requested_pages == [(0, True), (1, False)]
+    # the activities before the gap are not imported - and the last processed one does not move on
+    assert entry_data == {"last_bike_activity": "a35"}
+
+
+class ConcurrentActivityPages:
+    """Test version of get_activity_list_complete() (api.py) - the pages of the backend are
+    provided by '_fetch_activity_page()' (None for a page that could not be fetched)."""
+
+    def __init__(self, total_pages: int, page_size: int, failing_page: Optional[int] = None) -> None:
+        self.total_pages = total_pages
+        self.page_size = page_size
+        self.failing_page = failing_page
+        self.running = 0
+        self.max_running = 0
+
+    async def _fetch_activity_page(self, page: int) -> Optional[Dict[str, Any]]:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0)
+        self.running -= 1
+        if page == self.failing_page:
+            return None
+        return {
+            "data": [{"id": f"a{page * self.page_size + i}"} for i in range(self.page_size)],
+            "meta": {"pages": self.total_pages},
+        }
+
+    async def get_activity_list_complete(self) -> List[Dict[str, Any]]:
+        response = await self._fetch_activity_page(0)
+        if not response:
+            raise BoschEBikeAPIError("Activity page 0 could not be fetched")
+
+        activities = list(response["data"])
+        total_pages = response.get("meta", {}).get("pages", 0)
+        if total_pages > 1:
+            semaphore = asyncio.Semaphore(5)
+
+            async def _fetch_page(page: int) -> Optional[Dict[str, Any]]:
+                async with semaphore:
+                    return await self._fetch_activity_page(page)
+
+            responses = await asyncio.gather(*(_fetch_page(page) for page in range(1, total_pages)))
+            for page, page_response in enumerate(responses, start=1):
+                if not page_response:
+                    raise BoschEBikeAPIError(f"Activity page {page} could not be fetched")
+                activities.extend(page_response["data"])
+        return activities
+
+
+async def test_complete_list_keeps_the_page_order():
+    """The concurrently fetched pages are collected in the order of the backend (at most 5 at once)."""
+    backend = ConcurrentActivityPages(total_pages=12, page_size=3)
+    activities = await backend.get_activity_list_complete()
+
+    assert [a["id"] for a in activities] == [f"a{i}" for i in range(36)]
+    assert 1 < backend.max_running <= 5
+
+
+@pytest.mark.parametrize("failing_page", [0, 1, 7])
+async def test_complete_list_raises_on_a_failed_page(failing_page: int):
+    """A failed page must not shorten the complete list - it raises instead."""
+    backend = ConcurrentActivityPages(total_pages=8, page_size=3, failing_page=failing_page)
+    with pytest.raises(BoschEBikeAPIError) as err:
+        await backend.get_activity_list_complete()
+    assert f"page {failing_page}" in str(err.value)
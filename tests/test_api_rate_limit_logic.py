@@ -0,0 +1,109 @@
+"""Test the rate limit handling of the API client without Home Assistant dependencies."""
+# This test file tests the core logic directly without importing Home Assistant modules
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+
+class BoschEBikeAPIError(Exception):
+    """Test version of the API error (with the HTTP status code)."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class RateLimitedClient:
+    """Test version of the rate limit handling of BoschEBikeOAuthAPI._oauth_api_request().
+
+    This replicates the logic from api.py to test it independently - 'responses' are the
+    (status, headers, payload) tuples the backend will return one after the other.
+    """
+
+    def __init__(self, responses: List[Tuple[int, Dict[str, str], Any]], timeout: float = 10) -> None:
+        self._responses = responses
+        self._timeout = timeout
+        self._rate_limited_until = 0.0
+        self.requests = 0
+        self.sleeps: List[float] = []
+
+    @property
+    def rate_limit_remaining(self) -> float:
+        return max(self._rate_limited_until - time.monotonic(), 0.0)
+
+    async def _sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+
+    async def request(self) -> Any:
+        if time.monotonic() < self._rate_limited_until:
+            raise BoschEBikeAPIError("Rate limited - skipped request", 429)
+
+        for attempt in range(2):
+            self.requests += 1
+            status, headers, payload = self._responses.pop(0)
+            if status == 429:
+                retry_after = headers.get("Retry-After")
+                try:
+                    delay = float(retry_after) if retry_after else 30
+                except ValueError:
+                    delay = 30
+
+                self._rate_limited_until = time.monotonic() + delay
+                if attempt == 0 and delay <= self._timeout:
+                    await self._sleep(delay)
+                    continue
+                raise BoschEBikeAPIError("API request failed: 429", 429)
+            return payload
+        return None
+
+
+async def test_long_retry_after_is_not_waited_for():
+    """A 'Retry-After' longer than the request timeout is left to the next update."""
+    client = RateLimitedClient([(429, {"Retry-After": "120"}, None)])
+    with pytest.raises(BoschEBikeAPIError) as err:
+        await client.request()
+    assert err.value.status_code == 429
+    assert client.sleeps == []
+    assert 110 < client.rate_limit_remaining <= 120
+
+
+async def test_requests_are_gated_while_rate_limited():
+    """While rate limited, no request reaches the backend - and no (empty) data is returned."""
+    client = RateLimitedClient([(429, {"Retry-After": "120"}, None), (200, {}, {"status": True})])
+    with pytest.raises(BoschEBikeAPIError):
+        await client.request()
+
+    with pytest.raises(BoschEBikeAPIError) as err:
+        await client.request()
+    assert err.value.status_code == 429
+    assert client.requests == 1
+
+    # once the backend accepts requests again, the gate is open
+    client._rate_limited_until = time.monotonic() - 1
+    assert await client.request() == {"status": True}
+    assert client.requests == 2
+
+
+async def test_short_retry_after_is_retried_once():
+    """A short 'Retry-After' is waited for - and the request is retried once."""
+    client = RateLimitedClient([(429, {"Retry-After": "2"}, None), (200, {}, {"data": []})])
+    assert await client.request() == {"data": []}
+    assert client.sleeps == [2.0]
+    assert client.requests == 2
+
+
+async def test_second_429_raises():
+    """A second 429 raises the API error (instead of returning an empty payload)."""
+    client = RateLimitedClient([(429, {"Retry-After": "1"}, None), (429, {"Retry-After": "1"}, None)])
+    with pytest.raises(BoschEBikeAPIError) as err:
+        await client.request()
+    assert err.value.status_code == 429
+    assert client.requests == 2
+
+
+async def test_retry_after_http_date_uses_default():
+    """A 'Retry-After' HTTP date falls back to 30 seconds."""
+    client = RateLimitedClient([(429, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, None), (200, {}, {"data": []})], timeout=60)
+    assert await client.request() == {"data": []}
+    assert client.sleeps == [30]
@@ -0,0 +1,79 @@
+"""Test the conversion helpers of the bosch_data_handler module."""
+# bosch_data_handler has no Home Assistant dependencies - so it can be imported directly
+# (without the package __init__.py)
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "custom_components" / "bosch_ebike"))
+
+import bosch_data_handler  # noqa: E402
+
+
+def test_to_kilo_rounds_ints_half_up():
+    """Meter/Wh ints are converted to km/kWh with two decimals (half up)."""
+    assert bosch_data_handler._to_kilo(0) == 0.0
+    assert bosch_data_handler._to_kilo(1234) == 1.23
+    assert bosch_data_handler._to_kilo(1235) == 1.24
+    assert bosch_data_handler._to_kilo(1239) == 1.24
+    assert bosch_data_handler._to_kilo(12345678) == 12345.68
+
+
+def test_to_kilo_ints_match_round():
+    """Apart from the exact half values, the int conversion equals round(value / 1000, 2)."""
+    for a_val in range(0, 200000, 7):
+        if a_val % 10 != 5:
+            assert bosch_data_handler._to_kilo(a_val) == round(a_val / 1000, 2)
+
+
+def test_to_kilo_floats_and_negative_values():
+    """Floats and negative values are rounded with round()."""
+    assert bosch_data_handler._to_kilo(1500.0) == 1.5
+    assert bosch_data_handler._to_kilo(1239.9) == 1.24
+    assert bosch_data_handler._to_kilo(-1234) == -1.23
+
+
+def test_total_distance_in_km():
+    """The total distance (meters in the profile) is provided in km."""
+    data = {bosch_data_handler.KEY_PROFILE: {"driveUnit": {"totalDistanceTraveled": 1234567}}}
+    assert bosch_data_handler.get_total_distance(data) == 1234.57
+
+
+def test_total_distance_prefers_the_live_odometer():
+    """The odometer of the live state-of-charge is used before the profile value."""
+    data = {
+        bosch_data_handler.KEY_SOC: {"odometer": 1240005},
+        bosch_data_handler.KEY_PROFILE: {"driveUnit": {"totalDistanceTraveled": 1234567}},
+    }
+    assert bosch_data_handler.get_total_distance(data) == 1240.01
+
+
+def test_lifetime_energy_and_last_ride_distance():
+    """The delivered energy (Wh) and the ride distance (m) are converted the same way."""
+    data = {
+        bosch_data_handler.KEY_PROFILE: {"batteries": [{"deliveredWhOverLifetime": 98765}]},
+        bosch_data_handler.KEY_ACTIVITY: {"attributes": {"distance": 24305.5}},
+    }
+    assert bosch_data_handler.get_lifetime_energy_delivered(data) == 98.77
+    assert bosch_data_handler.get_last_ride_distance(data) == 24.31
+
+
+def test_assist_mode_ranges():
+    """The reachable ranges are sorted (highest first) - numeric strings are accepted, invalid entries skipped."""
+    data = {bosch_data_handler.KEY_PROFILE: {"driveUnit": {"driveUnitAssistModes": [
+        {"name": "ECO", "reachableRange": 120},
+        {"name": "TOUR", "reachableRange": "85"},
+        {"name": "TURBO", "reachableRange": 42.7},
+        {"name": "SPORT", "reachableRange": None},
+        {"name": "OFF"},
+        {"name": "BROKEN", "reachableRange": "n/a"},
+        "not a dict",
+    ]}}}
+    assert bosch_data_handler._get_assist_mode_ranges(data) == [120, 85, 42]
+    assert bosch_data_handler.get_battery_reachable_max_range(data) == 120
+    assert bosch_data_handler.get_battery_reachable_min_range(data) == 42
+
+
+def test_assist_mode_ranges_without_modes():
+    """Missing (or invalid) assist modes provide no ranges."""
+    assert bosch_data_handler._get_assist_mode_ranges({bosch_data_handler.KEY_PROFILE: {}}) == []
+    assert bosch_data_handler._get_assist_mode_ranges({bosch_data_handler.KEY_PROFILE: {"driveUnit": {"driveUnitAssistModes": None}}}) == []
@@ -0,0 +1,66 @@
+"""Test the authorization code extraction of the config flow without Home Assistant dependencies."""
+# This test file tests the core logic directly without importing Home Assistant modules
+import re
+from typing import Optional
+from urllib.parse import unquote_plus
+
+_CODE_PARAM_PATTERN = re.compile(r"[?&]code=([^&#]+)")
+
+
+def extract_authorization_code_logic(code_input: str) -> Optional[str]:
+    """Test version of _extract_authorization_code() (config_flow.py).
+
+    This replicates the logic from config_flow.py to test it independently.
+    """
+    authorization_code = code_input.strip()
+    if "code=" in authorization_code:
+        match = _CODE_PARAM_PATTERN.search(authorization_code)
+        authorization_code = unquote_plus(match.group(1)) if match else None
+    return authorization_code
+
+
+def test_plain_code():
+    """A plain code is used as it is (without surrounding whitespace)."""
+    assert extract_authorization_code_logic("  abc-123.def  ") == "abc-123.def"
+
+
+def test_code_as_first_query_parameter():
+    """The code is cut out of a complete redirect URL."""
+    url = "onebikeapp-ios://com.bosch.ebike.onebikeapp/oauth2redirect?code=abc-123&state=xyz"
+    assert extract_authorization_code_logic(url) == "abc-123"
+
+
+def test_code_as_later_query_parameter():
+    """The code can follow other query parameters."""
+    url = "onebikeapp-ios://com.bosch.ebike.onebikeapp/oauth2redirect?state=xyz&session_state=s1&code=abc-123"
+    assert extract_authorization_code_logic(url) == "abc-123"
+
+
+def test_code_followed_by_fragment():
+    """A fragment after the code is not part of it."""
+    url = "https://example.com/redirect?code=abc-123#fragment"
+    assert extract_authorization_code_logic(url) == "abc-123"
+
+
+def test_url_encoded_code():
+    """URL-encoded codes are decoded."""
+    url = "https://example.com/redirect?code=abc%2F123%3D%3D&state=xyz"
+    assert extract_authorization_code_logic(url) == "abc/123=="
+
+
+def test_other_parameter_ending_with_code_is_ignored():
+    """Parameters like 'xcode=' must not be taken as the code."""
+    url = "https://example.com/redirect?xcode=wrong&code=right"
+    assert extract_authorization_code_logic(url) == "right"
+
+
+def test_missing_code_value():
+    """A URL without a code value provides no code."""
+    assert extract_authorization_code_logic("https://example.com/redirect?code=&state=xyz") is None
+    assert extract_authorization_code_logic("https://example.com/redirect?xcode=abc") is None
+
+
+def test_pasted_url_with_surrounding_whitespace():
+    """A pasted redirect URL (with a trailing line break) provides the code."""
+    url = "  onebikeapp-ios://com.bosch.ebike.onebikeapp/oauth2redirect?code=abc-123\n"
+    assert extract_authorization_code_logic(url) == "abc-123"
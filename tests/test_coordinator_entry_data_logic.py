@@ -0,0 +1,130 @@
+"""Test the batched config entry data updates without Home Assistant dependencies."""
+# This test file tests the core logic directly without importing Home Assistant modules
+from typing import Any, Callable, Dict, List, Optional
+
+ENTRY_DATA_WRITE_DELAY_SECONDS = 5
+
+
+class MockTimerHandle:
+    """Mock asyncio.TimerHandle."""
+
+    def __init__(self, delay: float, callback: Callable[[], None]) -> None:
+        self.delay = delay
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class MockLoop:
+    """Mock event loop - only keeps track of the scheduled call_later() callbacks."""
+
+    def __init__(self) -> None:
+        self.handles: List[MockTimerHandle] = []
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> MockTimerHandle:
+        handle = MockTimerHandle(delay, callback)
+        self.handles.append(handle)
+        return handle
+
+    def run_pending(self) -> None:
+        for handle in self.handles:
+            if not handle.cancelled:
+                handle.cancelled = True
+                handle.callback()
+
+
+class EntryDataLogic:
+    """Test version of async_update_entry_data() and async_flush_entry_data() coordinator logic.
+
+    This replicates the logic from __init__.py (BoschEBikeDataUpdateCoordinator) to test it
+    independently - 'written' records every call of config_entries.async_update_entry().
+    """
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        self.loop = MockLoop()
+        self.data = data
+        self.written: List[Dict[str, Any]] = []
+        self._pending_entry_data: Dict[str, Any] = {}
+        self._pending_entry_data_handle: Optional[MockTimerHandle] = None
+
+    def async_update_entry_data(self, data: Dict[str, Any]) -> None:
+        self._pending_entry_data.update(data)
+        if self._pending_entry_data_handle is None:
+            self._pending_entry_data_handle = self.loop.call_later(ENTRY_DATA_WRITE_DELAY_SECONDS, self.async_flush_entry_data)
+
+    def async_flush_entry_data(self, event: Any = None) -> None:
+        if self._pending_entry_data_handle is not None:
+            self._pending_entry_data_handle.cancel()
+            self._pending_entry_data_handle = None
+
+        if len(self._pending_entry_data) > 0:
+            new_data = {**self.data, **self._pending_entry_data}
+            self._pending_entry_data = {}
+            self.data = new_data
+            self.written.append(new_data)
+
+
+def test_updates_are_batched():
+    """Multiple updates within the delay are written at once."""
+    logic = EntryDataLogic({"bike_id": "abc"})
+    logic.async_update_entry_data({"last_bike_activity": "a1"})
+    logic.async_update_entry_data({"subscription_status": {"value": True, "ts": 1}})
+    logic.async_update_entry_data({"last_bike_activity": "a2"})
+
+    # only a single write is scheduled - and nothing is written yet
+    assert len(logic.loop.handles) == 1
+    assert logic.loop.handles[0].delay == ENTRY_DATA_WRITE_DELAY_SECONDS
+    assert logic.written == []
+
+    logic.loop.run_pending()
+    assert logic.written == [{
+        "bike_id": "abc",
+        "last_bike_activity": "a2",
+        "subscription_status": {"value": True, "ts": 1},
+    }]
+
+
+def test_flush_writes_pending_data_and_cancels_the_timer():
+    """A flush (unload or HA stop) writes the pending data immediately."""
+    logic = EntryDataLogic({"bike_id": "abc"})
+    logic.async_update_entry_data({"last_bike_activity": "a1"})
+    handle = logic.loop.handles[0]
+
+    # called as listener of EVENT_HOMEASSISTANT_STOP
+    logic.async_flush_entry_data(event=object())
+    assert handle.cancelled is True
+    assert logic.written == [{"bike_id": "abc", "last_bike_activity": "a1"}]
+
+    # the cancelled timer must not write again
+    logic.loop.run_pending()
+    assert len(logic.written) == 1
+
+
+def test_flush_without_pending_data_does_not_write():
+    """Nothing is written, when there is no pending data."""
+    logic = EntryDataLogic({"bike_id": "abc"})
+    logic.async_flush_entry_data()
+    assert logic.written == []
+
+
+def test_update_after_flush_schedules_a_new_write():
+    """After a flush the next update schedules a new (delayed) write."""
+    logic = EntryDataLogic({"bike_id": "abc"})
+    logic.async_update_entry_data({"last_bike_activity": "a1"})
+    logic.async_flush_entry_data()
+
+    logic.async_update_entry_data({"last_bike_activity": "a2"})
+    assert len(logic.loop.handles) == 2
+    logic.loop.run_pending()
+    assert logic.written[-1] == {"bike_id": "abc", "last_bike_activity": "a2"}
+    assert len(logic.written) == 2
+
+
+def test_pending_values_replace_the_stored_ones():
+    """Pending values win over the stored entry data - all other keys are kept."""
+    logic = EntryDataLogic({"bike_id": "abc", "last_bike_activity": "a1", "token": "t"})
+    logic.async_update_entry_data({"last_bike_activity": "a5"})
+    logic.async_flush_entry_data()
+    assert logic.data == {"bike_id": "abc", "last_bike_activity": "a5", "token": "t"}
@@ -0,0 +1,161 @@
+"""Test the adaptive polling (live state-of-charge back-off) without Home Assistant dependencies."""
+# This test file tests the core logic directly without importing Home Assistant modules
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+MAX_OFFLINE_SCAN_INTERVAL_MINUTES = 60
+CHARGING_SCAN_INTERVAL_MINUTES = 2
+MAX_SKIPPED_SOC_UPDATES = 3
+
+
+class SocPollingLogic:
+    """Test version of the should_fetch_soc() and adjust_update_interval() coordinator logic.
+
+    This replicates the logic from __init__.py (BoschEBikeDataUpdateCoordinator) to test it
+    independently - the random jitter is passed in, so the results are deterministic.
+    """
+
+    def __init__(self, base_minutes: int = 5, has_flow_subscription: bool = True) -> None:
+        self.has_flow_subscription = has_flow_subscription
+        self._base_update_interval = timedelta(minutes=base_minutes)
+        self.update_interval = self._base_update_interval
+        self._soc_unavailable_count = 0
+        self._soc_skipped_updates = 0
+        self.battery: Dict[str, Any] = {}
+        self.data: Optional[Dict[str, Any]] = {}
+
+    def should_fetch_soc(self) -> bool:
+        if not self.has_flow_subscription:
+            return False
+
+        if self._soc_unavailable_count == 0 or self.data is None:
+            return True
+
+        if self.battery.get("isChargerConnected") or self.battery.get("isCharging"):
+            self._soc_skipped_updates = 0
+            return True
+
+        max_skipped_updates = min(2 ** (self._soc_unavailable_count - 1) - 1, MAX_SKIPPED_SOC_UPDATES,
+                                  int(MAX_OFFLINE_SCAN_INTERVAL_MINUTES * 60 // self.update_interval.total_seconds()) - 1)
+        if self._soc_skipped_updates >= max_skipped_updates:
+            self._soc_skipped_updates = 0
+            return True
+
+        self._soc_skipped_updates += 1
+        return False
+
+    def adjust_update_interval(self, soc_data: Optional[Dict[str, Any]], jitter_seconds: float = 0) -> None:
+        if soc_data is not None:
+            self._soc_unavailable_count = 0
+            base_update_interval = self._base_update_interval
+            if soc_data.get("chargingActive"):
+                base_update_interval = min(base_update_interval, timedelta(minutes=CHARGING_SCAN_INTERVAL_MINUTES))
+            self.update_interval = base_update_interval + timedelta(seconds=jitter_seconds)
+        else:
+            self._soc_unavailable_count = min(self._soc_unavailable_count + 1, 10)
+            self.update_interval = min(self._base_update_interval * 2 ** self._soc_unavailable_count,
+                                       timedelta(minutes=max(MAX_OFFLINE_SCAN_INTERVAL_MINUTES, self._base_update_interval.total_seconds() / 60)))
+
+    def update(self, soc_data: Optional[Dict[str, Any]]) -> bool:
+        """One coordinator update - returns, if the live state-of-charge has been requested."""
+        fetch_soc = self.should_fetch_soc()
+        if fetch_soc:
+            self.adjust_update_interval(soc_data)
+        return fetch_soc
+
+
+def _max_minutes_without_soc_request(logic: SocPollingLogic, updates: int) -> float:
+    """Let the bike be offline for n updates - and return the longest time between two SoC requests."""
+    elapsed = timedelta(0)
+    last_request = timedelta(0)
+    longest = timedelta(0)
+    for _ in range(updates):
+        if logic.update(soc_data=None):
+            longest = max(longest, elapsed - last_request)
+            last_request = elapsed
+        elapsed += logic.update_interval
+    return longest.total_seconds() / 60
+
+
+def test_no_soc_without_subscription():
+    """Without a Flow subscription there is never live data."""
+    logic = SocPollingLogic(has_flow_subscription=False)
+    assert logic.should_fetch_soc() is False
+
+
+def test_soc_requested_while_online():
+    """As long as the bike provides live data, the SoC is requested on every update."""
+    logic = SocPollingLogic()
+    for _ in range(5):
+        assert logic.update(soc_data={"stateOfCharge": 80}) is True
+    assert logic.update_interval == timedelta(minutes=5)
+
+
+def test_skipped_soc_requests_grow_while_offline():
+    """While the bike is offline, 0, 1, 3 updates are skipped between the SoC requests - and
+    none, once the update interval itself has reached the maximum."""
+    logic = SocPollingLogic(base_minutes=1)
+    requested = [logic.update(soc_data=None) for _ in range(16)]
+    assert requested[:8] == [True, True, False, True, False, False, False, True]
+    assert logic.update_interval == timedelta(minutes=MAX_OFFLINE_SCAN_INTERVAL_MINUTES)
+    assert all(requested[-3:])
+
+
+def test_interval_doubles_while_offline_up_to_the_maximum():
+    """The update interval doubles with every missing SoC - up to the maximum."""
+    logic = SocPollingLogic(base_minutes=5)
+    intervals = []
+    for _ in range(8):
+        logic.adjust_update_interval(soc_data=None)
+        intervals.append(logic.update_interval.total_seconds() / 60)
+    assert intervals == [10, 20, 40, 60, 60, 60, 60, 60]
+
+
+def test_offline_interval_does_not_shrink_a_longer_base_interval():
+    """A configured scan interval above the maximum is kept."""
+    logic = SocPollingLogic(base_minutes=90)
+    logic.adjust_update_interval(soc_data=None)
+    assert logic.update_interval == timedelta(minutes=90)
+
+
+def test_combined_back_off_is_bounded():
+    """The skipped SoC requests and the extended interval must not add up beyond the maximum."""
+    for base_minutes in (1, 2, 5, 10, 15, 30, 60):
+        logic = SocPollingLogic(base_minutes=base_minutes)
+        assert _max_minutes_without_soc_request(logic, updates=50) <= MAX_OFFLINE_SCAN_INTERVAL_MINUTES
+
+
+def test_charger_connected_requests_soc_immediately():
+    """A connected charger (from the profile) ends the back-off."""
+    logic = SocPollingLogic(base_minutes=1)
+    logic.update(soc_data=None)
+    logic.update(soc_data=None)
+    assert logic.should_fetch_soc() is False
+
+    logic.battery = {"isChargerConnected": True}
+    assert logic.should_fetch_soc() is True
+    assert logic._soc_skipped_updates == 0
+
+
+def test_live_data_resets_the_back_off():
+    """With live data the base interval (plus jitter) is used again."""
+    logic = SocPollingLogic(base_minutes=5)
+    for _ in range(4):
+        logic.adjust_update_interval(soc_data=None)
+
+    logic.adjust_update_interval(soc_data={"stateOfCharge": 50}, jitter_seconds=10)
+    assert logic._soc_unavailable_count == 0
+    assert logic.update_interval == timedelta(minutes=5, seconds=10)
+    assert logic.should_fetch_soc() is True
+
+
+def test_charging_shortens_the_interval():
+    """While charging, the bike is polled at least every CHARGING_SCAN_INTERVAL_MINUTES."""
+    logic = SocPollingLogic(base_minutes=5)
+    logic.adjust_update_interval(soc_data={"chargingActive": True})
+    assert logic.update_interval == timedelta(minutes=CHARGING_SCAN_INTERVAL_MINUTES)
+
+    # a shorter configured interval is kept
+    logic = SocPollingLogic(base_minutes=1)
+    logic.adjust_update_interval(soc_data={"chargingActive": True})
+    assert logic.update_interval == timedelta(minutes=1)